@@ -15,6 +15,7 @@ Key Features:
 
 import json
 import logging
+import re
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
@@ -27,6 +28,15 @@ from .types import LLMRefinementResult
 logger = logging.getLogger(__name__)
 
 
+def compile_phrase_pattern(phrases: List[str]) -> "re.Pattern[str]":
+    """
+    Compile phrases into one alternation so a single scan replaces a per-phrase
+    `in` loop. Matches anywhere in the text, same as the substring checks.
+    """
+    ordered = sorted(set(phrases), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(phrase) for phrase in ordered))
+
+
 class BoundaryViolationType(Enum):
     """Types of boundary violations that can occur."""
     ADJUSTMENT_EXCEEDED = "adjustment_exceeded"
@@ -109,6 +119,13 @@ class AIRefinementBoundaryAuditor:
             "but", "however", "although", "though", "yet", "still",
             "nevertheless", "nonetheless", "despite", "while"
         ]
+        
+        # Compiled once; the lists above stay as the editable source of truth
+        self._sarcasm_re = compile_phrase_pattern(self.sarcasm_indicators)
+        self._slang_re = compile_phrase_pattern(
+            [slang for slang_list in self.cultural_slang_patterns.values() for slang in slang_list]
+        )
+        self._mixed_sentiment_re = compile_phrase_pattern(self.mixed_sentiment_indicators)
     
     def audit_refinement(
         self,
@@ -232,17 +249,13 @@ class AIRefinementBoundaryAuditor:
         combined_text = ' '.join(content).lower()
         
         # Detect sarcasm
-        sarcasm_detected = any(indicator in combined_text for indicator in self.sarcasm_indicators)
+        sarcasm_detected = self._sarcasm_re.search(combined_text) is not None
         
         # Detect cultural slang
-        cultural_slang_detected = False
-        for slang_list in self.cultural_slang_patterns.values():
-            if any(slang in combined_text for slang in slang_list):
-                cultural_slang_detected = True
-                break
+        cultural_slang_detected = self._slang_re.search(combined_text) is not None
         
         # Detect mixed sentiment
-        mixed_sentiment_detected = any(indicator in combined_text for indicator in self.mixed_sentiment_indicators)
+        mixed_sentiment_detected = self._mixed_sentiment_re.search(combined_text) is not None
         
         return {
             'sarcasm_detected': sarcasm_detected,
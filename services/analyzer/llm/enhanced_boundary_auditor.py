@@ -18,6 +18,7 @@ from collections import defaultdict, deque
 import statistics
 
 from shared.schemas.domain import DataCompleteness
+from .boundary_auditor import compile_phrase_pattern
 from .types import LLMRefinementResult
 
 logger = logging.getLogger(__name__)
@@ -141,6 +142,15 @@ class EnhancedAIRefinementBoundaryAuditor:
             "waste of time", "can't believe", "who approves"
         ]
         
+        # Compiled once per auditor rather than scanned phrase by phrase per audit
+        self._sarcasm_re = compile_phrase_pattern(self.sarcasm_indicators)
+        self._slang_res = {
+            category: compile_phrase_pattern(slang_list)
+            for category, slang_list in self.cultural_slang_patterns.items()
+        }
+        self._mixed_sentiment_re = compile_phrase_pattern(self.mixed_sentiment_indicators)
+        self._adversarial_re = compile_phrase_pattern(self.adversarial_patterns)
+        
         # Statistical tracking
         self.hourly_violations = deque(maxlen=24)  # 24-hour rolling window
         self.daily_violations = deque(maxlen=30)     # 30-day rolling window
@@ -307,18 +317,17 @@ class EnhancedAIRefinementBoundaryAuditor:
         word_count = len(combined_text.split())
         
         # Detect various content types
-        sarcasm_detected = any(indicator in combined_text for indicator in self.sarcasm_indicators)
+        sarcasm_detected = self._sarcasm_re.search(combined_text) is not None
         
-        cultural_slang_detected = False
-        cultural_categories = []
-        for category, slang_list in self.cultural_slang_patterns.items():
-            if any(slang in combined_text for slang in slang_list):
-                cultural_slang_detected = True
-                cultural_categories.append(category)
+        cultural_categories = [
+            category for category, pattern in self._slang_res.items()
+            if pattern.search(combined_text)
+        ]
+        cultural_slang_detected = bool(cultural_categories)
         
-        mixed_sentiment_detected = any(indicator in combined_text for indicator in self.mixed_sentiment_indicators)
+        mixed_sentiment_detected = self._mixed_sentiment_re.search(combined_text) is not None
         
-        adversarial_detected = any(pattern in combined_text for pattern in self.adversarial_patterns)
+        adversarial_detected = self._adversarial_re.search(combined_text) is not None
         
         # Calculate complexity score (0-1)
         complexity_factors = [
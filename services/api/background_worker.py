@@ -155,7 +155,8 @@ class BackgroundWorker:
             )
             
             # Run scan
-            scan_result = await scraper.run_scan(handle)
+            async with scraper:
+                scan_result = await scraper.run_scan(handle)
             
             # Check scan results
             if scan_result.data_completeness == DataCompleteness.UNAVAILABLE:
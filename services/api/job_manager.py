@@ -46,6 +46,8 @@ class JobRegistry:
         self._ttl = timedelta(hours=ttl_hours)
         self._cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
         self._lock = asyncio.Lock()
+        # Signalled (under _lock) on every job change so status long-polls wake immediately
+        self._changed = asyncio.Condition(self._lock)
         self._cleanup_task: Optional[asyncio.Task] = None
     
     async def start_cleanup_task(self):
@@ -97,6 +99,24 @@ class JobRegistry:
         async with self._lock:
             return self._jobs.get(job_id)
     
+    async def wait_for_update(self, job_id: str, since: Optional[datetime], timeout: float) -> Optional[JobState]:
+        """
+        Long-poll for a job change.
+        Returns as soon as the job was updated after `since` (immediately when `since`
+        is None or the job has finished or gone), otherwise its state after `timeout` seconds.
+        """
+        def ready() -> bool:
+            job = self._jobs.get(job_id)
+            return (job is None or since is None or job.updated_at > since
+                    or job.status in (ScrapeStatus.COMPLETED, ScrapeStatus.FAILED))
+        
+        async with self._changed:
+            try:
+                await asyncio.wait_for(self._changed.wait_for(ready), timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self._jobs.get(job_id)
+    
     async def update_job_status(
         self, 
         job_id: str, 
@@ -120,6 +140,7 @@ class JobRegistry:
             if status in [ScrapeStatus.COMPLETED, ScrapeStatus.FAILED]:
                 job.completed_at = datetime.utcnow()
             
+            self._changed.notify_all()
             return True
     
     async def set_job_report(self, job_id: str, report: ReportResponse) -> bool:
@@ -136,6 +157,7 @@ class JobRegistry:
             job.completed_at = datetime.utcnow()
             job.updated_at = datetime.utcnow()
             
+            self._changed.notify_all()
             return True
     
     async def increment_retry(self, job_id: str) -> bool:
@@ -149,6 +171,7 @@ class JobRegistry:
             job.last_retry_at = datetime.utcnow()
             job.updated_at = datetime.utcnow()
             
+            self._changed.notify_all()
             return True
     
     async def _periodic_cleanup(self):
@@ -180,6 +203,9 @@ class JobRegistry:
                 if handle_key in self._handle_index and self._handle_index[handle_key] == job_id:
                     del self._handle_index[handle_key]
                 del self._jobs[job_id]
+            
+            if expired_jobs:
+                self._changed.notify_all()
 
 # Global job registry instance
 job_registry = JobRegistry()
\ No newline at end of file
@@ -1,14 +1,18 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from services.api.routes import reports, async_routes, governance
 from services.api.job_manager import job_registry
 from services.api.background_worker import background_worker
 from services.governance.middleware import governance_middleware
+from services.scraper.core.browser import stop_playwright
+from services.scraper.core.log_writer import scrape_log_writer
 from services.governance.core.killswitch import KillSwitch
 from services.governance.core.rate_limiter import rate_limiter
 from services.governance.core.token_manager import token_manager
 
-app = FastAPI(title="SponsorScope API", version="1.0.0")
+# Reports carry large nested score/evidence payloads; orjson encodes them in C
+app = FastAPI(title="SponsorScope API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -53,6 +57,12 @@ async def shutdown_event():
     # Stop job registry cleanup task
     await job_registry.stop_cleanup_task()
     
+    # Stop the shared Playwright driver used by the browser scrapers
+    await stop_playwright()
+    
+    # Write out scrape metadata still buffered by the log writer
+    await scrape_log_writer.close()
+    
     print("Async pipeline shutdown completed")
 
 @app.get("/health")
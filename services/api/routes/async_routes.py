@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from datetime import datetime, timezone
 from typing import Optional
 from services.api.models.async_models import (
     AnalyzeRequest, 
@@ -65,24 +66,35 @@ async def submit_analysis(request: AnalyzeRequest, background_tasks: BackgroundT
         raise HTTPException(status_code=500, detail=f"Failed to submit analysis: {str(e)}")
 
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=30, description="Long-poll: seconds to hold the request open for a change"),
+    since: Optional[datetime] = Query(None, description="Long-poll: updated_at of the last status the client saw")
+):
     """
     Get the current status and progress of an analysis job.
+    With `wait`, the request is held until the job changes after `since`
+    (or finishes) instead of the client sleeping between polls.
     
-    Performance target: ≤100ms response time
+    Performance target: ≤100ms response time (immediate queries)
     """
     start_time = time.time()
     
     try:
-        # Get job state from registry
-        job = await job_registry.get_job(job_id)
+        # Get job state from registry, long-polling for a change when asked to
+        if wait > 0:
+            if since is not None and since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            job = await job_registry.wait_for_update(job_id, since, wait)
+        else:
+            job = await job_registry.get_job(job_id)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
         # Ensure response time target (≤100ms)
         elapsed = time.time() - start_time
-        if elapsed > 0.1:  # 100ms
+        if elapsed > 0.1 and wait == 0:  # 100ms
             print(f"Warning: Status query took {elapsed*1000:.1f}ms")
         
         return JobStatusResponse(
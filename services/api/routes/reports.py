@@ -49,7 +49,8 @@ async def get_report(handle: str):
     # 2. Run Scan
     # This fetches "mock" data from the adapter, but using the real interface structure
     await gp.pacer.await_pacing(handle, 0)
-    scan_result = await scraper.run_scan(handle)
+    async with scraper:
+        scan_result = await scraper.run_scan(handle)
     
     if scan_result.data_completeness == DataCompleteness.UNAVAILABLE:
         raise HTTPException(status_code=404, detail=f"Handle @{handle} not found on Instagram.")
@@ -76,6 +76,14 @@ class InstagramScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Failed to cleanup Playwright scraper: {e}")
             
+    async def __aenter__(self):
+        # Browser setup stays lazy so the simulation fallback still works
+        # when Playwright cannot start.
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+            
     # Simulation methods (kept for fallback/demo purposes)
     
     def _get_seed(self, handle: str) -> int:
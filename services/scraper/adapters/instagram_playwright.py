@@ -1,73 +1,184 @@
 import asyncio
 import json
 import logging
+import os
 import re
 import time
-from datetime import datetime, timedelta
+import weakref
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 from urllib.parse import urljoin
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, CDPSession, Page, TimeoutError as PlaywrightTimeoutError
 from shared.schemas.raw import RawProfile, RawPost, RawComment
 from shared.schemas.domain import Platform, DataCompleteness
 from services.scraper.core.interface import BaseScraper
 from services.scraper.core.types import ScrapeResult
+from services.scraper.core.browser import PagePool, STEALTH_JS, get_browser, get_playwright
+from services.scraper.core.log_writer import SCRAPE_LOG_DIR, scrape_log_writer
+from services.scraper.core.scan_cache import scan_cache
+from services.scraper.core.utils import parse_count
 
 logger = logging.getLogger(__name__)
 
+PROFILE_URL = "https://www.instagram.com/{handle}/"
+
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-blink-features=AutomationControlled'
+]
+
+# Common laptop resolution: still a desktop layout, with about half the pixels of 1080p to render
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1366, 'height': 768},
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York'
+}
+
+# Extraction only reads DOM text/attributes, so skip everything that is just bytes on the wire
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Page selectors, kept in one place so layout changes are a one-line fix
+HEADER_SELECTOR = 'header'
+META_DESCRIPTION_SELECTOR = 'meta[property="og:description"]'
+FOLLOWERS_SELECTOR = 'a[href*="/followers/"] span'
+FOLLOWING_SELECTOR = 'a[href*="/following/"] span'
+POSTS_STAT_SELECTOR = 'header li:has-text("post") span'
+BIO_SELECTOR = 'header h1, header div[class*="bio"]'
+VERIFIED_SELECTOR = '[aria-label="Verified"]'
+POST_LINK_SELECTOR = 'a[href*="/p/"], article a'
+POST_ENGAGEMENT_SELECTOR = 'span, div[class*="like"], div[class*="comment"]'
+POST_READY_SELECTOR = 'article'
+LOGIN_WALL_SELECTOR = '[data-testid="login-form"], input[name="username"], ._ab3w'
+CHALLENGE_SELECTOR = '[data-testid="challenge"]'
+
+# The profile header or a blocking marker, whichever renders first: a login wall or
+# challenge page settles the wait immediately instead of running out the timeout
+PROFILE_READY_SELECTOR = ', '.join((HEADER_SELECTOR, LOGIN_WALL_SELECTOR, CHALLENGE_SELECTOR))
+
+# Profile pages kept open for concurrent multi-handle scans
+PAGE_POOL_SIZE = int(os.getenv('SCRAPER_POOL_SIZE', '5'))
+
+# Maximum post pages loaded at once while collecting comments
+COMMENT_CONCURRENCY = 4
+
+# Posts rendered per profile-grid scroll, and the readiness check used after each scroll
+POSTS_PER_SCROLL = 12
+POST_LINK_COUNT_JS = "(n) => document.querySelectorAll('a[href*=\"/p/\"]').length >= n"
+
+# Blocking signals: structural checks plus one body-text snapshot, fetched in a single
+# Runtime.evaluate over the page's CDP session
+BLOCKING_PROBE_JS = f"""
+(() => ({{
+    login: !!document.querySelector({json.dumps(LOGIN_WALL_SELECTOR)}),
+    challenge: !!document.querySelector({json.dumps(CHALLENGE_SELECTOR)}),
+    text: document.body ? document.body.innerText : ''
+}}))()
+"""
+
+# '<n> <metric>' pairs in og:description ("1.2M Followers, 1,234 Following, 7 Posts"), in one pass
+META_STATS_RE = re.compile(r'(\d[\d.,]*[KMB]?)\s+(followers?|following|posts?)\b', re.IGNORECASE)
+META_STAT_FIELDS = {'follower': 'follower_count', 'following': 'following_count', 'post': 'post_count'}
+
+# Body text plus every comment's text/author, collected in a single page.evaluate per post
+COMMENTS_EXTRACT_JS = """
+(limit) => ({
+    text: document.body ? document.body.innerText : '',
+    comments: Array.from(document.querySelectorAll('ul[class*="comment"], div[class*="comment"], article ul li'))
+        .slice(0, limit)
+        .map((el) => {
+            const text = Array.from(el.querySelectorAll('span, div[class*="text"]'))
+                .map((t) => t.innerText)
+                .find((t) => t && t.length > 2);
+            const author = el.querySelector('a[href*="/"], h3, h4');
+            return {
+                text: text || '',
+                href: author ? author.getAttribute('href') : null,
+                author: author ? author.innerText : ''
+            };
+        })
+})
+"""
+COMMENTS_DISABLED_RE = re.compile(r'comments.disabled|no.comments', re.IGNORECASE)
+
+RATE_LIMIT_RE = re.compile(r'rate.limited|too.many.requests|try.again.later', re.IGNORECASE)
+CHALLENGE_RE = re.compile(r'challenge|suspicious|verify', re.IGNORECASE)
+PRIVATE_RE = re.compile(r'private.account|follow.to.see|this.account.is.private', re.IGNORECASE)
+NOT_FOUND_RE = re.compile(r'sorry|page.not.found|couldn.t.find', re.IGNORECASE)
+
+BLOCKING_MESSAGES = (
+    ('login', "Login wall detected"),
+    ('rate_limited', "Rate limiting detected"),
+    ('challenge', "Challenge/captcha detected"),
+    ('private', "Private profile detected"),
+    ('not_found', "Profile not found (404)"),
+)
+
+async def _route_filter(route):
+    """Abort image, media, font and stylesheet requests; let documents, scripts and XHR through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _warn_not_closed(name: str):
+    logger.warning(f"{name} was garbage collected without cleanup(); use 'async with' to close the browser")
+
 class InstagramPlaywrightScraper(BaseScraper):
+    """
+    Playwright-backed Instagram scraper.
+    Use as `async with InstagramPlaywrightScraper() as scraper:` so the browser is always closed.
+    """
+    
     def __init__(self):
         super().__init__(platform=Platform.INSTAGRAM)
         self.browser: Optional[Browser] = None
+        self._shared_browser = False
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.session_metadata: Dict[str, Any] = {}
+        self._log_date: Optional[date] = None
+        self._log_file: Optional[Path] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._cdp_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._blocking_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._page_pool: Optional[PagePool] = None
         
     async def _setup_browser(self):
         """Initialize Playwright browser with defensive settings."""
-        playwright = await async_playwright().start()
-        
-        # Launch Chromium with defensive settings
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-blink-features=AutomationControlled'
-            ]
-        )
+        # Attach to a long-lived external Chromium when one is configured,
+        # otherwise open a context on the process-wide Chromium (launched once
+        # with defensive settings and shared by every scraper)
+        cdp_endpoint = os.getenv('PW_CDP_ENDPOINT')
+        if cdp_endpoint:
+            playwright = await get_playwright()
+            self.browser = await playwright.chromium.connect_over_cdp(cdp_endpoint)
+        else:
+            self.browser = await get_browser(LAUNCH_ARGS)
+            self._shared_browser = True
         
         # Create context with realistic viewport and user agent
         self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-US',
-            timezone_id='America/New_York'
+            **CONTEXT_OPTIONS
         )
         
+        await self.context.route("**/*", _route_filter)
+        
         # Add stealth script to avoid detection
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            window.chrome = {
-                runtime: {},
-            };
-            
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-        """)
+        await self.context.add_init_script(STEALTH_JS)
         
         self.page = await self.context.new_page()
+        self._finalizer = weakref.finalize(self, _warn_not_closed, type(self).__name__)
         
         # Set session metadata
         self.session_metadata = {
@@ -79,38 +190,53 @@ class InstagramPlaywrightScraper(BaseScraper):
         
         logger.info(f"Browser initialized: {self.session_metadata}")
         
-    async def _detect_blocking_mechanisms(self) -> List[str]:
+    async def _cdp_session(self, page: Page) -> CDPSession:
+        """Return the page's raw CDP session, opening it on first use."""
+        session = self._cdp_sessions.get(page)
+        if session is None:
+            session = await page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = session
+        return session
+        
+    async def _cdp_evaluate(self, page: Page, expression: str) -> Any:
+        """Evaluate `expression` with Runtime.evaluate, bypassing Playwright's evaluate wrapping."""
+        session = await self._cdp_session(page)
+        response = await session.send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if response.get('exceptionDetails'):
+            raise RuntimeError(response['exceptionDetails'].get('text', 'Runtime.evaluate failed'))
+        return response.get('result', {}).get('value')
+        
+    async def _goto(self, page: Page, url: str):
+        """Navigate `page`, dropping its cached blocking verdict."""
+        self._blocking_cache.pop(page, None)
+        await page.goto(url, wait_until='networkidle', timeout=30000)
+        
+    async def _detect_blocking_mechanisms(self, page: Optional[Page] = None) -> List[str]:
         """Detect Instagram's blocking mechanisms."""
+        page = page or self.page
         errors = []
         
-        if not self.page:
+        if not page:
             return ["Browser not initialized"]
             
+        # The page has not navigated since the last probe, so its verdict still holds
+        cached = self._blocking_cache.get(page)
+        if cached is not None:
+            return list(cached)
+            
         try:
-            # Check for login wall
-            login_elements = await self.page.query_selector_all('[data-testid="login-form"], input[name="username"], r"._ab3w"')
-            if login_elements:
-                errors.append("Login wall detected")
-                
-            # Check for rate limiting messages
-            rate_limit_elements = await self.page.query_selector_all('text=/rate.limited|too.many.requests|try.again.later/i')
-            if rate_limit_elements:
-                errors.append("Rate limiting detected")
-                
-            # Check for challenge/captcha
-            challenge_elements = await self.page.query_selector_all('[data-testid="challenge"], text=/challenge|suspicious|verify/i')
-            if challenge_elements:
-                errors.append("Challenge/captcha detected")
-                
-            # Check for private profile
-            private_elements = await self.page.query_selector_all('text=/private.account|follow.to.see|this.account.is.private/i')
-            if private_elements:
-                errors.append("Private profile detected")
-                
-            # Check for 404/not found
-            not_found_elements = await self.page.query_selector_all('text=/sorry|page.not.found|couldn.t.find/i')
-            if not_found_elements:
-                errors.append("Profile not found (404)")
+            # One round-trip fetches structural flags and the page text
+            snapshot = await self._cdp_evaluate(page, BLOCKING_PROBE_JS) or {}
+            text = snapshot.get('text') or ''
+            signals = {
+                'login': snapshot.get('login'),
+                'rate_limited': RATE_LIMIT_RE.search(text),
+                'challenge': snapshot.get('challenge') or CHALLENGE_RE.search(text),
+                'private': PRIVATE_RE.search(text),
+                'not_found': NOT_FOUND_RE.search(text)
+            }
+            errors.extend(message for signal, message in BLOCKING_MESSAGES if signals[signal])
+            self._blocking_cache[page] = tuple(errors)
                 
         except Exception as e:
             logger.error(f"Error detecting blocking mechanisms: {e}")
@@ -118,107 +244,26 @@ class InstagramPlaywrightScraper(BaseScraper):
             
         return errors
         
-    async def _extract_profile_data(self, handle: str) -> Optional[RawProfile]:
+    async def _extract_profile_data(self, handle: str, page: Optional[Page] = None) -> Optional[RawProfile]:
         """Extract profile data from Instagram page."""
-        if not self.page:
+        page = page or self.page
+        if not page:
             return None
             
         try:
             # Navigate to profile page
-            profile_url = f"https://www.instagram.com/{handle}/"
-            await self.page.goto(profile_url, wait_until='networkidle', timeout=30000)
+            await self._goto(page, PROFILE_URL.format(handle=handle))
             
-            # Wait for profile content to load
-            await self.page.wait_for_selector('header', timeout=10000)
+            # Wait for profile content, or a blocking marker, to load
+            await page.wait_for_selector(PROFILE_READY_SELECTOR, timeout=10000)
             
             # Check for blocking mechanisms
-            blocking_errors = await self._detect_blocking_mechanisms()
+            blocking_errors = await self._detect_blocking_mechanisms(page)
             if blocking_errors:
                 logger.warning(f"Blocking mechanisms detected for {handle}: {blocking_errors}")
                 return None
             
-            # Extract profile data using multiple strategies
-            profile_data = {}
-            
-            # Strategy 1: Try to extract from meta tags
-            try:
-                meta_description = await self.page.get_attribute('meta[property="og:description"]', 'content')
-                if meta_description:
-                    # Parse follower/following/post counts from meta description
-                    numbers = re.findall(r'([\d,]+)\s+(\w+)', meta_description)
-                    for number, metric in numbers:
-                        number_clean = int(number.replace(',', ''))
-                        if 'follower' in metric.lower():
-                            profile_data['follower_count'] = number_clean
-                        elif 'following' in metric.lower():
-                            profile_data['following_count'] = number_clean
-                        elif 'post' in metric.lower():
-                            profile_data['post_count'] = number_clean
-            except Exception as e:
-                logger.debug(f"Meta extraction failed: {e}")
-                
-            # Strategy 2: Extract from page structure
-            try:
-                # Look for follower count elements
-                follower_elements = await self.page.query_selector_all('a[href*="/followers/"] span')
-                if follower_elements and len(follower_elements) > 0:
-                    try:
-                        follower_text = await follower_elements[0].inner_text()
-                        profile_data['follower_count'] = self._parse_count(follower_text)
-                    except Exception as e:
-                        logger.debug(f"Failed to extract follower count: {e}")
-                
-                # Look for following count
-                following_elements = await self.page.query_selector_all('a[href*="/following/"] span')
-                if following_elements and len(following_elements) > 1:
-                    try:
-                        following_text = await following_elements[1].inner_text()
-                        profile_data['following_count'] = self._parse_count(following_text)
-                    except Exception as e:
-                        logger.debug(f"Failed to extract following count: {e}")
-                    
-                # Look for post count
-                post_elements = await self.page.query_selector_all('header span')
-                for element in post_elements:
-                    try:
-                        text = await element.inner_text()
-                        if 'post' in text.lower() or re.match(r'^\d+[kKmM]?$', text):
-                            profile_data['post_count'] = self._parse_count(text)
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to extract post count from element: {e}")
-                        continue
-                        
-            except Exception as e:
-                logger.debug(f"Structure extraction failed: {e}")
-                
-            # Strategy 3: Extract bio and verification
-            try:
-                # Extract bio
-                bio_elements = await self.page.query_selector_all('header h1, header div[class*="bio"]')
-                if bio_elements and len(bio_elements) > 0:
-                    try:
-                        profile_data['bio'] = await bio_elements[0].inner_text()
-                    except Exception as e:
-                        logger.debug(f"Failed to extract bio: {e}")
-                    
-                # Check for verification badge
-                verified_elements = await self.page.query_selector_all('[aria-label="Verified"]')
-                profile_data['is_verified'] = len(verified_elements) > 0
-                
-            except Exception as e:
-                logger.debug(f"Bio/verification extraction failed: {e}")
-                
-            # Strategy 4: Extract from JavaScript objects
-            try:
-                # Look for window._sharedData or similar
-                shared_data = await self.page.evaluate('window._sharedData')
-                if shared_data:
-                    logger.debug(f"Found shared data: {type(shared_data)}")
-                    # Parse shared data if available
-                    
-            except Exception as e:
-                logger.debug(f"JavaScript data extraction failed: {e}")
+            profile_data = await self._profile_from_dom(page)
                 
             # Fill in defaults for missing data
             profile_data.setdefault('follower_count', 0)
@@ -242,42 +287,105 @@ class InstagramPlaywrightScraper(BaseScraper):
             logger.error(f"Failed to extract profile data for {handle}: {e}")
             return None
             
-    def _parse_count(self, text: str) -> int:
-        """Parse Instagram count format (e.g., '1.2K' -> 1200)."""
-        text = text.strip().lower()
+    async def _profile_from_dom(self, page: Page) -> Dict[str, Any]:
+        """Extract profile data from the rendered profile page using multiple strategies."""
+        profile_data = {}
         
-        # Remove commas
-        text = text.replace(',', '')
-        
-        # Handle K, M, B suffixes
-        if text.endswith('k'):
-            return int(float(text[:-1]) * 1000)
-        elif text.endswith('m'):
-            return int(float(text[:-1]) * 1000000)
-        elif text.endswith('b'):
-            return int(float(text[:-1]) * 1000000000)
+        # Strategy 1: Try to extract from meta tags
+        try:
+            meta_description = await page.get_attribute(META_DESCRIPTION_SELECTOR, 'content')
+            if meta_description:
+                # Parse follower/following/post counts (abbreviated or not) from meta description
+                for count, metric in META_STATS_RE.findall(meta_description):
+                    profile_data[META_STAT_FIELDS[metric.lower().rstrip('s')]] = self._parse_count(count)
+        except Exception as e:
+            logger.debug(f"Meta extraction failed: {e}")
+            
+        # Strategies 2 and 3 probe independent header elements, so the
+        # selector round-trips are issued together instead of one by one
+        probes = await asyncio.gather(
+            page.query_selector_all(FOLLOWERS_SELECTOR),
+            page.query_selector_all(FOLLOWING_SELECTOR),
+            page.query_selector(POSTS_STAT_SELECTOR),
+            page.query_selector_all(BIO_SELECTOR),
+            page.query_selector_all(VERIFIED_SELECTOR),
+            return_exceptions=True
+        )
+        for probe in probes:
+            if isinstance(probe, Exception):
+                logger.debug(f"Header probe failed: {probe}")
+        follower_elements, following_elements, post_element, bio_elements, verified_elements = (
+            None if isinstance(probe, Exception) else probe for probe in probes
+        )
         
-        # Try to parse as plain number
+        # Strategy 2: Extract from page structure
+        if follower_elements and len(follower_elements) > 0:
+            try:
+                follower_text = await follower_elements[0].inner_text()
+                profile_data['follower_count'] = self._parse_count(follower_text)
+            except Exception as e:
+                logger.debug(f"Failed to extract follower count: {e}")
+                
+        if following_elements and len(following_elements) > 1:
+            try:
+                following_text = await following_elements[1].inner_text()
+                profile_data['following_count'] = self._parse_count(following_text)
+            except Exception as e:
+                logger.debug(f"Failed to extract following count: {e}")
+                
+        # Post count (the header stat labelled "posts")
+        if post_element:
+            try:
+                post_text = await post_element.inner_text()
+                profile_data['post_count'] = self._parse_count(post_text)
+            except Exception as e:
+                logger.debug(f"Failed to extract post count: {e}")
+                
+        # Strategy 3: Extract bio and verification
+        if bio_elements and len(bio_elements) > 0:
+            try:
+                profile_data['bio'] = await bio_elements[0].inner_text()
+            except Exception as e:
+                logger.debug(f"Failed to extract bio: {e}")
+                
+        # Check for verification badge (only when the probe itself succeeded)
+        if verified_elements is not None:
+            profile_data['is_verified'] = len(verified_elements) > 0
+            
+        # Strategy 4: Extract from JavaScript objects
         try:
-            return int(float(text))
-        except ValueError:
-            return 0
+            # Look for window._sharedData or similar
+            shared_data = await page.evaluate('window._sharedData')
+            if shared_data:
+                logger.debug(f"Found shared data: {type(shared_data)}")
+                # Parse shared data if available
+                
+        except Exception as e:
+            logger.debug(f"JavaScript data extraction failed: {e}")
+        
+        return profile_data
+        
+    def _parse_count(self, text: str) -> int:
+        """Parse Instagram count format (e.g., '1.2K' -> 1200)."""
+        return parse_count(text)
             
-    async def _extract_posts(self, profile: RawProfile, limit: int = 12) -> List[RawPost]:
+    async def _extract_posts(self, profile: RawProfile, limit: int = 12, page: Optional[Page] = None) -> List[RawPost]:
         """Extract recent posts from profile page."""
+        page = page or self.page
         posts = []
         
-        if not self.page:
+        if not page:
             return posts
             
         try:
-            # Scroll to load posts
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            # Scroll until enough post links have rendered
+            await self._scroll_for_posts(limit, page)
             
             # Look for post links
-            post_links = await self.page.query_selector_all('a[href*="/p/"], article a')
+            post_links = await page.query_selector_all(POST_LINK_SELECTOR)
             
+            # Placeholder timestamps (one day apart) share a single clock read
+            now = datetime.utcnow()
             for i, link in enumerate(post_links[:limit]):
                 try:
                     post_url = await link.get_attribute('href')
@@ -292,7 +400,7 @@ class InstagramPlaywrightScraper(BaseScraper):
                     post_data = {
                         'id': f"post_{profile.handle}_{i}",
                         'url': post_url,
-                        'timestamp': datetime.utcnow() - timedelta(days=i),
+                        'timestamp': now - timedelta(days=i),
                         'like_count': 0,
                         'comment_count': 0,
                         'media_urls': [],
@@ -302,7 +410,7 @@ class InstagramPlaywrightScraper(BaseScraper):
                     # Try to extract engagement data from the post element
                     try:
                         # Look for like/comment indicators
-                        engagement_elements = await link.query_selector_all('span, div[class*="like"], div[class*="comment"]')
+                        engagement_elements = await link.query_selector_all(POST_ENGAGEMENT_SELECTOR)
                         for element in engagement_elements:
                             text = await element.inner_text()
                             if any(indicator in text.lower() for indicator in ['like', '❤', '♥']):
@@ -333,107 +441,96 @@ class InstagramPlaywrightScraper(BaseScraper):
             
         return posts
         
-    async def _extract_comments(self, post: RawPost, limit: int = 50) -> List[RawComment]:
-        """Extract comments from a specific post."""
+    async def _scroll_for_posts(self, limit: int, page: Optional[Page] = None):
+        """Scroll the profile grid, returning as soon as `limit` post links are present or loading stalls."""
+        page = page or self.page
+        loaded = 0
+        while loaded < limit:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            target = min(limit, loaded + POSTS_PER_SCROLL)
+            try:
+                await page.wait_for_function(POST_LINK_COUNT_JS, arg=target, timeout=5000)
+            except PlaywrightTimeoutError:
+                break
+            loaded = target
+            
+    async def _extract_comments(self, post: RawPost, limit: int = 50, page: Optional[Page] = None) -> List[RawComment]:
+        """Extract comments from a specific post (on `page`, defaulting to the scraper's page)."""
         comments = []
+        page = page or self.page
         
-        if not self.page:
+        if not page:
             return comments
             
         try:
             # Navigate to post page
-            await self.page.goto(post.url, wait_until='networkidle', timeout=30000)
+            await self._goto(page, post.url)
             
             # Wait for comments to load
-            await self.page.wait_for_selector('article', timeout=10000)
+            await page.wait_for_selector(POST_READY_SELECTOR, timeout=10000)
+            
+            # Body text and comment nodes come back from one evaluate instead of
+            # several round-trips per comment element
+            snapshot = await page.evaluate(COMMENTS_EXTRACT_JS, limit) or {}
             
             # Check if comments are disabled
-            disabled_elements = await self.page.query_selector_all('text=/comments.disabled|no.comments/i')
-            if disabled_elements:
+            if COMMENTS_DISABLED_RE.search(snapshot.get('text') or ''):
                 logger.info(f"Comments disabled for post {post.id}")
                 return comments
                 
-            # Look for comment elements
-            comment_elements = await self.page.query_selector_all('ul[class*="comment"], div[class*="comment"], article ul li')
-            
-            for i, comment_element in enumerate(comment_elements[:limit]):
-                try:
-                    # Extract comment text
-                    text_elements = await comment_element.query_selector_all('span, div[class*="text"]')
-                    comment_text = ""
-                    if text_elements and len(text_elements) > 0:
-                        for text_element in text_elements:
-                            try:
-                                text = await text_element.inner_text()
-                                if text and len(text) > 2:  # Filter out very short text
-                                    comment_text = text
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Failed to extract comment text: {e}")
-                                continue
-                            
-                    if not comment_text:
-                        continue
-                        
-                    # Extract author
-                    author_elements = await comment_element.query_selector_all('a[href*="/"], h3, h4')
-                    author_id = "unknown"
-                    if author_elements and len(author_elements) > 0:
-                        try:
-                            author_href = await author_elements[0].get_attribute('href')
-                            if author_href:
-                                author_id = author_href.strip('/').split('/')[0] if '/' in author_href else f"user_{i}"
-                            else:
-                                author_text = await author_elements[0].inner_text()
-                                author_id = author_text.strip('@').split()[0]
-                        except Exception as e:
-                            logger.debug(f"Failed to extract author: {e}")
-                            
-                    # Create RawComment
-                    comments.append(RawComment(
-                        id=f"comment_{post.id}_{i}",
-                        text=comment_text,
-                        timestamp=post.timestamp + timedelta(minutes=i * 5),
-                        author_id=author_id,
-                        like_count=0,
-                        reply_count=0
-                    ))
-                    
-                except Exception as e:
-                    logger.debug(f"Failed to extract comment {i}: {e}")
+            for i, item in enumerate(snapshot.get('comments') or []):
+                comment_text = item.get('text')
+                if not comment_text:
                     continue
                     
+                # Extract author
+                author_id = "unknown"
+                author_href = item.get('href')
+                if author_href:
+                    author_id = author_href.strip('/').split('/')[0] if '/' in author_href else f"user_{i}"
+                elif item.get('author'):
+                    author_id = item['author'].strip('@').split()[0]
+                    
+                # Create RawComment
+                comments.append(RawComment(
+                    id=f"comment_{post.id}_{i}",
+                    text=comment_text,
+                    timestamp=post.timestamp + timedelta(minutes=i * 5),
+                    author_id=author_id,
+                    like_count=0,
+                    reply_count=0
+                ))
+                
         except Exception as e:
             logger.error(f"Failed to extract comments for post {post.id}: {e}")
             
         return comments
         
-    async def _log_scrape_metadata(self, handle: str, errors: List[str], data_completeness: DataCompleteness):
+    async def _log_scrape_metadata(self, handle: str, errors: List[str], data_completeness: DataCompleteness,
+                                   session_id: Optional[str] = None, cache_hit: bool = False):
         """Log structured scrape metadata."""
+        now = datetime.utcnow()
         log_entry = {
             'handle': handle,
             'platform': 'instagram',
-            'scraped_at': datetime.utcnow().isoformat(),
-            'ip_session': self.session_metadata.get('session_id', 'unknown'),
+            'scraped_at': now,
+            'ip_session': session_id or self.session_metadata.get('session_id', 'unknown'),
             'browser_version': self.session_metadata.get('browser_version', 'unknown'),
             'failure_reason': errors[0] if errors else None,
             'data_completeness': data_completeness.value,
+            'cache_hit': cache_hit,
             'session_metadata': self.session_metadata
         }
         
-        # Ensure logs directory exists
-        import os
-        logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
-        os.makedirs(logs_dir, exist_ok=True)
+        await scrape_log_writer.write(self._get_log_file(now), log_entry)
         
-        # Write log entry
-        log_file = os.path.join(logs_dir, f'instagram_scrape_{datetime.utcnow().strftime("%Y%m%d")}.jsonl')
-        
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
-        except Exception as e:
-            logger.error(f"Failed to write scrape metadata log: {e}")
+    def _get_log_file(self, now: datetime) -> Path:
+        """Return today's log path, rebuilding it only when the UTC date rolls over."""
+        today = now.date()
+        if today != self._log_date:
+            self._log_date = today
+            self._log_file = SCRAPE_LOG_DIR / f'instagram_scrape_{today:%Y%m%d}.jsonl'
+        return self._log_file
             
     async def scrape_profile(self, handle: str) -> Optional[RawProfile]:
         """Scrape Instagram profile data."""
@@ -450,13 +547,29 @@ class InstagramPlaywrightScraper(BaseScraper):
         """Scrape comments from a specific post."""
         return await self._extract_comments(post, limit)
         
-    async def run_scan(self, handle: str) -> ScrapeResult:
-        """Run complete scan: profile, posts, and comments."""
+    async def _cached_scan(self, handle: str) -> Optional[ScrapeResult]:
+        """Return a recent scan of `handle` from the shared cache (marked ARCHIVAL), logging the hit."""
+        cached = scan_cache.get(self.platform, handle)
+        if cached is not None:
+            await self._log_scrape_metadata(handle, cached.errors, cached.data_completeness, cache_hit=True)
+        return cached
+        
+    async def run_scan(self, handle: str, page: Optional[Page] = None) -> ScrapeResult:
+        """
+        Run complete scan: profile, posts, and comments.
+        Pass `page` (e.g. from a shared page pool) to scan on an already-open
+        page and skip launching this scraper's own browser.
+        """
+        # Repeat queries within the cache TTL never touch the browser
+        cached = await self._cached_scan(handle)
+        if cached is not None:
+            return cached
+            
         errors = []
         completeness = DataCompleteness.FULL
         
         # Initialize browser if needed
-        if not self.page:
+        if page is None and not self.page:
             try:
                 await self._setup_browser()
             except Exception as e:
@@ -467,19 +580,25 @@ class InstagramPlaywrightScraper(BaseScraper):
                     errors=errors
                 )
                 
-        # Generate session ID for logging
-        self.session_metadata['session_id'] = f"{handle}_{int(time.time())}"
+        # Pooled pages carry their own context for comment fan-out
+        if page is None:
+            page, context = self.page, self.context
+        else:
+            context = page.context
+            
+        # Session ID for logging (kept local: pooled scans run concurrently)
+        session_id = f"{handle}_{int(time.time())}"
         
         # 1. Profile
         profile = None
         try:
-            profile = await self.scrape_profile(handle)
+            profile = await self._extract_profile_data(handle, page)
         except Exception as e:
             errors.append(f"Profile extraction error: {str(e)}")
             logger.error(f"Profile extraction failed for {handle}: {e}")
             
         if not profile:
-            blocking_errors = await self._detect_blocking_mechanisms()
+            blocking_errors = await self._detect_blocking_mechanisms(page)
             if blocking_errors:
                 errors.extend(blocking_errors)
                 completeness = DataCompleteness.UNAVAILABLE
@@ -487,34 +606,37 @@ class InstagramPlaywrightScraper(BaseScraper):
                 errors.append("Profile not found or extraction failed")
                 completeness = DataCompleteness.FAILED
                 
-            await self._log_scrape_metadata(handle, errors, completeness)
+            await self._log_scrape_metadata(handle, errors, completeness, session_id)
             return ScrapeResult(
                 data_completeness=completeness,
                 errors=errors
             )
             
-        # 2. Posts
+        # 2. Posts (read from the grid on the profile page that is already loaded)
         posts = []
         try:
-            posts = await self.scrape_posts(profile)
+            posts = await self._extract_posts(profile, page=page)
             if not posts and profile.post_count > 0:
                 errors.append("No posts extracted despite profile showing posts")
-                completeness = DataCompleteness.PARTIAL_NO_POSTS
+                completeness = DataCompleteness.PARTIAL_NO_COMMENTS
         except Exception as e:
             errors.append(f"Post extraction error: {str(e)}")
             if profile.post_count > 0:
-                completeness = DataCompleteness.PARTIAL_NO_POSTS
+                completeness = DataCompleteness.PARTIAL_NO_COMMENTS
                 
-        # 3. Comments
+        # 3. Comments (one batched call, demultiplexed per post)
         all_comments = []
         comments_blocked_count = 0
         
+        try:
+            comments_by_post = await self._extract_comments_batch(posts, context=context, page=page)
+        except Exception as e:
+            logger.debug(f"Comment extraction failed for {handle}: {e}")
+            comments_by_post = {}
         for post in posts:
-            try:
-                post_comments = await self.scrape_comments(post)
-                all_comments.extend(post_comments)
-            except Exception as e:
-                logger.debug(f"Comment extraction failed for post {post.id}: {e}")
+            if post.id in comments_by_post:
+                all_comments.extend(comments_by_post[post.id])
+            else:
                 comments_blocked_count += 1
                 
         # Update completeness based on comment availability
@@ -526,31 +648,113 @@ class InstagramPlaywrightScraper(BaseScraper):
             errors.append(f"Comments blocked on {comments_blocked_count} posts")
             
         # Log scrape metadata
-        await self._log_scrape_metadata(handle, errors, completeness)
+        await self._log_scrape_metadata(handle, errors, completeness, session_id)
         
-        return ScrapeResult(
+        result = ScrapeResult(
             profile=profile,
             posts=posts,
             comments=all_comments,
             data_completeness=completeness,
             errors=errors
         )
+        scan_cache.put(self.platform, handle, result)
+        return result
         
+    async def run_scan_many(self, handles: List[str]) -> List[ScrapeResult]:
+        """
+        Scan several handles concurrently on one browser context.
+        Each scan borrows a page from a pool of PAGE_POOL_SIZE pages, so that
+        many scans are in flight at most and none of them share a page.
+        Results are returned in the same order as `handles`.
+        """
+        if not self.context:
+            try:
+                await self._setup_browser()
+            except Exception as e:
+                errors = [f"Browser initialization failed: {str(e)}"]
+                for handle in handles:
+                    await self._log_scrape_metadata(handle, errors, DataCompleteness.FAILED)
+                return [
+                    ScrapeResult(data_completeness=DataCompleteness.FAILED, errors=list(errors))
+                    for _ in handles
+                ]
+                
+        if self._page_pool is None:
+            self._page_pool = PagePool(self.context, PAGE_POOL_SIZE)
+            
+        async def scan_one(handle: str) -> ScrapeResult:
+            async with self._page_pool.acquire() as page:
+                return await self.run_scan(handle, page=page)
+                
+        return await asyncio.gather(*(scan_one(handle) for handle in handles))
+        
+    async def _extract_comments_batch(self, posts: List[RawPost], limit: int = 50,
+                                      context: Optional[BrowserContext] = None,
+                                      page: Optional[Page] = None) -> Dict[str, List[RawComment]]:
+        """
+        Extract comments for all `posts`, keyed by post id.
+        Posts load concurrently on their own pages in `context` (bounded by a semaphore);
+        posts whose extraction failed are left out of the result.
+        """
+        page = page or self.page
+        context = context or self.context
+        semaphore = asyncio.Semaphore(COMMENT_CONCURRENCY if context else 1)
+        results = await asyncio.gather(
+            *(self._scrape_post_comments(post, semaphore, context, page, limit) for post in posts),
+            return_exceptions=True
+        )
+        
+        comments_by_post = {}
+        for post, result in zip(posts, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Comment extraction failed for post {post.id}: {result}")
+            else:
+                comments_by_post[post.id] = result
+        return comments_by_post
+        
+    async def _scrape_post_comments(self, post: RawPost, semaphore: asyncio.Semaphore,
+                                    context: Optional[BrowserContext], page: Page,
+                                    limit: int = 50) -> List[RawComment]:
+        """Scrape one post's comments on its own page in `context` so posts load concurrently."""
+        async with semaphore:
+            if not context:
+                return await self._extract_comments(post, limit, page=page)
+                
+            post_page = await context.new_page()
+            try:
+                return await self._extract_comments(post, limit, page=post_page)
+            finally:
+                await post_page.close()
+                
     async def cleanup(self):
         """Clean up browser resources."""
+        await scrape_log_writer.flush()
         try:
+            # Pages close concurrently; the context and browser follow, since
+            # closing them would tear the pages down underneath those calls
+            closers = []
+            if self._page_pool:
+                closers.append(self._page_pool.close())
+                self._page_pool = None
             if self.page:
-                await self.page.close()
+                closers.append(self.page.close())
+            for result in await asyncio.gather(*closers, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Cleanup error: {result}")
             if self.context:
                 await self.context.close()
-            if self.browser:
+            if self.browser and not self._shared_browser:
                 await self.browser.close()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
+        finally:
+            if self._finalizer:
+                self._finalizer.detach()
+                self._finalizer = None
             
-    def __del__(self):
-        """Ensure cleanup on deletion."""
-        try:
-            asyncio.get_event_loop().run_until_complete(self.cleanup())
-        except Exception:
-            pass
\ No newline at end of file
+    async def __aenter__(self):
+        await self._setup_browser()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
@@ -26,30 +26,34 @@ class TikTokScraper(BaseScraper):
         )
         
     async def scrape_posts(self, profile: RawProfile, limit: int = 30) -> List[RawPost]:
-        posts = []
-        for i in range(min(limit, 5)):
-            posts.append(RawPost(
+        platform = self.platform
+        now = datetime.utcnow()
+        url_base = f"https://tiktok.com/@{profile.handle}/video/"
+        return [
+            RawPost(
                 id=f"tt_post_{i}",
-                platform=self.platform,
-                url=f"https://tiktok.com/@{profile.handle}/video/{i}",
-                timestamp=datetime.utcnow(),
+                platform=platform,
+                url=f"{url_base}{i}",
+                timestamp=now,
                 like_count=5000,
                 comment_count=100,
                 is_video=True,
                 media_urls=["http://example.com/video.mp4"]
-            ))
-        return posts
+            )
+            for i in range(min(limit, 5))
+        ]
         
     async def scrape_comments(self, post: RawPost, limit: int = 50) -> List[RawComment]:
-        comments = []
-        for i in range(min(limit, 5)):
-            comments.append(RawComment(
+        now = datetime.utcnow()
+        return [
+            RawComment(
                 id=f"tt_comment_{post.id}_{i}",
                 text=f"Cool video {i}",
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 author_id=f"tt_user_{i}"
-            ))
-        return comments
+            )
+            for i in range(min(limit, 5))
+        ]
         
     async def run_scan(self, handle: str) -> ScrapeResult:
         # Simplified scan logic similar to Instagram
@@ -1,77 +1,262 @@
 import asyncio
+import itertools
 import json
 import logging
+import os
 import re
 import time
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import weakref
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Set
 from urllib.parse import urljoin
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from shared.schemas.raw import RawProfile, RawPost, RawComment
 from shared.schemas.domain import Platform, DataCompleteness
 from services.scraper.core.interface import BaseScraper
 from services.scraper.core.types import ScrapeResult
+from services.scraper.core.browser import STEALTH_JS, get_browser, get_playwright
+from services.scraper.core.log_writer import SCRAPE_LOG_DIR, scrape_log_writer
+from services.scraper.core.scan_cache import scan_cache
+from services.scraper.core.utils import parse_count
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on browser contexts kept alive for run_scan_many
+CONTEXT_POOL_SIZE = int(os.getenv('SCRAPER_POOL_SIZE', '5'))
+
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-blink-features=AutomationControlled'
+]
+
+# Realistic viewport, shared by launched and persistent contexts
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York'
+}
+
+# Chromium user agents only, so the UA never contradicts the engine fingerprint;
+# rotated per context so pooled contexts do not all present the same client
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+_user_agent_cycle = itertools.cycle(USER_AGENTS)
+
+# Video pages loaded at once while scraping comments within a single scan
+COMMENT_CONCURRENCY = 4
+
+# Default for navigations without an explicit timeout (e.g. video pages)
+NAVIGATION_TIMEOUT_MS = 8000
+
+# Extraction only reads DOM text/attributes, so skip everything that is just bytes on the wire
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+# Telemetry endpoints only: the static bundles (tiktokcdn.com/obj/) and the
+# mssdk request signer are needed to render the video grid and call the comment API
+BLOCKED_URL_PARTS = ('tiktok.com/api/log',)
+
+# DOM selectors used from Python; alternatives are comma-joined into one selector per query
+USER_INFO_SELECTOR = '[data-e2e="user-info"]'
+FOLLOWERS_SELECTOR = '[data-e2e="followers-count"]'
+FOLLOWING_SELECTOR = '[data-e2e="following-count"]'
+LIKES_SELECTOR = '[data-e2e="likes-count"]'
+BIO_SELECTOR = '[data-e2e="user-desc"], .user-bio, h2[data-e2e="user-subtitle"]'
+VERIFIED_SELECTOR = '[data-e2e="user-verified"], .verified-badge, svg[fill*="verified"]'
+STATS_TEXT_SELECTOR = 'h2[data-e2e="user-subtitle"], div[data-e2e="user-desc"] span'
+POST_ITEM_SELECTOR = '[data-e2e="user-post-item"]'
+POST_LINK_SELECTOR = '[data-e2e="user-post-item"] a, a[href*="/video/"]'
+COMMENT_READY_SELECTOR = '[data-e2e="video-comment"]'
+COMMENT_ITEM_SELECTOR = '[data-e2e="video-comment"], [data-e2e="comment-item"], div[class*="comment"]'
+LOGIN_WALL_SELECTOR = '[data-e2e="login-button"], [data-e2e="modal-login"], .login-container'
+CAPTCHA_SELECTOR = '[data-e2e="captcha"], .captcha-container'
+
+# The profile header or a blocking marker, whichever renders first: a blocked page
+# settles the wait as soon as its login wall or captcha shows up
+PROFILE_READY_SELECTOR = ', '.join((USER_INFO_SELECTOR, LOGIN_WALL_SELECTOR, CAPTCHA_SELECTOR))
+
+# Selectors handed to PROFILE_SNAPSHOT_JS
+PROFILE_SNAPSHOT_SELECTORS = {
+    'userInfo': USER_INFO_SELECTOR,
+    'followers': FOLLOWERS_SELECTOR,
+    'following': FOLLOWING_SELECTOR,
+    'likes': LIKES_SELECTOR,
+    'bio': BIO_SELECTOR,
+    'verified': VERIFIED_SELECTOR,
+    'statsText': STATS_TEXT_SELECTOR
+}
+
+# Blocking signals: structural checks plus one body-text snapshot, fetched in a single page.evaluate
+BLOCKING_PROBE_JS = f"""
+() => ({{
+    login: !!document.querySelector({json.dumps(LOGIN_WALL_SELECTOR)}),
+    challenge: !!document.querySelector({json.dumps(CAPTCHA_SELECTOR)}),
+    text: document.body ? document.body.innerText : ''
+}})
+"""
+
+# Everything the profile strategies read, fetched in one round-trip: the server-rendered
+# profile state (older pages ship SIGI_STATE, newer ones the rehydration blob), the
+# og:description summary, and the texts/flags of the profile header elements
+PROFILE_SNAPSHOT_JS = """
+(sel) => {
+    const state = document.getElementById('SIGI_STATE') || document.getElementById('__UNIVERSAL_DATA_FOR_REHYDRATION__');
+    const og = document.querySelector('meta[property="og:description"]');
+    const text = (s) => { const el = document.querySelector(s); return el ? el.innerText : null; };
+    return {
+        state: state ? state.textContent : null,
+        ogDescription: og ? og.getAttribute('content') : null,
+        userInfo: !!document.querySelector(sel.userInfo),
+        followers: text(sel.followers),
+        following: text(sel.following),
+        likes: text(sel.likes),
+        bio: text(sel.bio),
+        verified: !!document.querySelector(sel.verified),
+        statsTexts: Array.from(document.querySelectorAll(sel.statsText)).map(el => el.innerText)
+    };
+}
+"""
+
+# Per-video href and engagement texts, extracted in a single $$eval
+VIDEO_ITEMS_JS = """
+(links, limit) => links.slice(0, limit).map(a => ({
+    href: a.getAttribute('href'),
+    stats: Array.from(a.querySelectorAll(
+        '[data-e2e="video-like-count"], [data-e2e="video-comment-count"], [data-e2e="video-share-count"], ' +
+        '[data-e2e="video-view-count"], span[class*="like"], span[class*="comment"], span[class*="share"], span[class*="view"]'
+    )).map(el => el.innerText)
+}))
+"""
+
+# Per-comment text (first span longer than 2 chars) and author, extracted in a single $$eval
+COMMENT_ITEMS_JS = """
+(els, limit) => els.slice(0, limit).map(el => {
+    const text = Array.from(el.querySelectorAll('[data-e2e="comment-text"], span[class*="text"], div[class*="text"]'))
+        .map(t => t.innerText)
+        .find(t => t && t.length > 2);
+    const author = el.querySelector('[data-e2e="comment-username"], a[href*="/@"], h3, h4');
+    return {
+        text: text || '',
+        authorHref: author ? author.getAttribute('href') : null,
+        authorText: author ? author.innerText : ''
+    };
+})
+"""
+
+# Comment list endpoint used by TikTok's web app; answers with the session cookies from a profile visit
+COMMENT_API_URL = 'https://www.tiktok.com/api/comment/list/'
+VIDEO_ID_RE = re.compile(r'/video/(\d+)')
+
+# First count-looking token in an engagement label, e.g. '1.2M' in '1.2M views'
+COUNT_TOKEN_RE = re.compile(r'\d[\d,.]*(?:[kmb](?![a-z]))?')
+
+# Profile stat numbers in bio/subtitle text, and '<n> <metric>' pairs in og:description
+STATS_NUMBER_RE = re.compile(r'[\d,]+\.?\d*[kKmM]?')
+META_COUNT_RE = re.compile(r'(\d[\d,]*)\s+(\w+)')
+
+# Fields that make a profile complete; the strategy cascade stops once all are present
+PROFILE_FIELDS = frozenset({'follower_count', 'following_count', 'like_count', 'bio', 'is_verified'})
+
+BODY_TEXT_JS = "() => document.body ? document.body.innerText : ''"
+COMMENTS_DISABLED_RE = re.compile(r'comments.disabled|no.comments|comments.off', re.IGNORECASE)
+
+RATE_LIMIT_RE = re.compile(r'too.many.requests|rate.limited|try.again.later', re.IGNORECASE)
+CHALLENGE_RE = re.compile(r'verify|challenge|captcha', re.IGNORECASE)
+PRIVATE_RE = re.compile(r'private.account|follow.to.see|this.account.is.private', re.IGNORECASE)
+NOT_FOUND_RE = re.compile(r'user.not.found|page.not.available|couldn.t.find', re.IGNORECASE)
+
+BLOCKING_MESSAGES = (
+    ('login', "Login wall detected"),
+    ('rate_limited', "Rate limiting detected"),
+    ('challenge', "Challenge/captcha detected"),
+    ('private', "Private profile detected"),
+    ('not_found', "Profile not found (404)"),
+)
+
+# Session-level blocks (not per-profile states like private/not found) open the circuit
+CIRCUIT_BREAKING_ERRORS = frozenset(
+    message for signal, message in BLOCKING_MESSAGES if signal in ('login', 'rate_limited', 'challenge')
+)
+CIRCUIT_BASE_BACKOFF = 30.0
+CIRCUIT_MAX_BACKOFF = 600.0
+
+async def _route_filter(route):
+    """Abort heavy or tracking requests; let documents, scripts and XHR through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _warn_not_closed(name: str):
+    logger.warning(f"{name} was garbage collected without cleanup(); use 'async with' to close the browser")
+
 class TikTokPlaywrightScraper(BaseScraper):
+    """
+    Playwright-backed TikTok scraper.
+    Use as `async with TikTokPlaywrightScraper() as scraper:` so the browser is always closed.
+    """
+    
     def __init__(self):
         super().__init__(platform=Platform.TIKTOK)
         self.browser: Optional[Browser] = None
+        self._shared_browser = False
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.session_metadata: Dict[str, Any] = {}
+        self._log_date: Optional[date] = None
+        self._log_file: Optional[Path] = None
+        self._idle_contexts: Optional[asyncio.Queue] = None
+        self._pooled_contexts: List[BrowserContext] = []
+        self._creating_contexts = 0
+        self._context_pages: Dict[BrowserContext, Page] = {}
+        self._retired_contexts: Set[BrowserContext] = set()
+        self._blocked_until = 0.0
+        self._block_strikes = 0
+        self._finalizer: Optional[weakref.finalize] = None
         
     async def _setup_browser(self):
         """Initialize Playwright browser with defensive settings."""
-        playwright = await async_playwright().start()
-        
-        # Launch Chromium with defensive settings
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-blink-features=AutomationControlled'
-            ]
-        )
-        
-        # Create context with realistic viewport and user agent
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-US',
-            timezone_id='America/New_York'
-        )
-        
-        # Add stealth script to avoid detection
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            window.chrome = {
-                runtime: {},
-            };
+        user_data_dir = os.getenv('TT_USERDATA')
+        if user_data_dir:
+            playwright = await get_playwright()
+            # Persistent profile keeps TikTok's JS/CSS bundles and V8 code cache
+            # on disk between runs; it is a cache only, no login state is needed
+            self.context = await playwright.chromium.launch_persistent_context(
+                user_data_dir,
+                headless=True,
+                args=LAUNCH_ARGS,
+                user_agent=next(_user_agent_cycle),
+                **CONTEXT_OPTIONS
+            )
+            self.browser = self.context.browser
+            await self._prepare_context(self.context)
+        else:
+            # Open a fresh context on the process-wide Chromium, launched once
+            # with defensive settings and shared by every scraper
+            self.browser = await get_browser(LAUNCH_ARGS)
+            self._shared_browser = True
+            self.context = await self._new_context()
             
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-        """)
-        
         self.page = await self.context.new_page()
+        self._finalizer = weakref.finalize(self, _warn_not_closed, type(self).__name__)
         
         # Set session metadata
         self.session_metadata = {
-            'browser_version': await self.browser.version(),
+            'browser_version': await self.browser.version() if self.browser else 'unknown',
             'user_agent': await self.page.evaluate('navigator.userAgent'),
             'platform': 'tiktok',
             'session_start': datetime.utcnow().isoformat()
@@ -79,38 +264,113 @@ class TikTokPlaywrightScraper(BaseScraper):
         
         logger.info(f"Browser initialized: {self.session_metadata}")
         
-    async def _detect_blocking_mechanisms(self) -> List[str]:
+    async def _new_context(self) -> BrowserContext:
+        """Create an isolated context with realistic viewport, user agent and stealth script."""
+        context = await self.browser.new_context(user_agent=next(_user_agent_cycle), **CONTEXT_OPTIONS)
+        await self._prepare_context(context)
+        return context
+        
+    async def _prepare_context(self, context: BrowserContext):
+        """Apply navigation timeout, resource filtering and stealth script to a context."""
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        
+        # Routes are per context, so a future evidence/screenshot context can opt out
+        await context.route("**/*", _route_filter)
+        
+        await context.add_init_script(STEALTH_JS)
+        
+    @asynccontextmanager
+    async def _acquire_context(self):
+        """
+        Borrow a context from the pool, growing it lazily up to CONTEXT_POOL_SIZE.
+        Contexts are returned to the pool afterwards so cookies and warm caches
+        carry over to the next handle instead of paying for a fresh context.
+        """
+        if not self.browser:
+            # Persistent profile: there is exactly one context, pages stay separate
+            yield self.context
+            return
+            
+        if self._idle_contexts is None:
+            self._idle_contexts = asyncio.Queue()
+            
+        if self._idle_contexts.empty() and len(self._pooled_contexts) + self._creating_contexts < CONTEXT_POOL_SIZE:
+            # Reserve the slot before awaiting so concurrent callers don't overshoot the pool size
+            self._creating_contexts += 1
+            try:
+                context = await self._new_context()
+            finally:
+                self._creating_contexts -= 1
+            self._pooled_contexts.append(context)
+        else:
+            context = await self._idle_contexts.get()
+            
+        try:
+            yield context
+        finally:
+            if context in self._retired_contexts:
+                context = await self._rotate_context(context)
+            self._idle_contexts.put_nowait(context)
+            
+    async def _rotate_context(self, context: BrowserContext) -> BrowserContext:
+        """Replace a context TikTok has fingerprinted with a fresh one (new cookies, new user agent)."""
+        self._retired_contexts.discard(context)
+        self._pooled_contexts.remove(context)
+        self._context_pages.pop(context, None)
+        # Keep the slot reserved while the replacement is built
+        self._creating_contexts += 1
+        try:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close retired context: {e}")
+            replacement = await self._new_context()
+        finally:
+            self._creating_contexts -= 1
+        self._pooled_contexts.append(replacement)
+        return replacement
+            
+    @asynccontextmanager
+    async def _acquire_page(self):
+        """
+        Borrow the long-lived page of a pooled context. Scans just goto() on it,
+        skipping new_page and init-script setup; it closes with its context.
+        """
+        async with self._acquire_context() as context:
+            if context is self.context:
+                # Persistent profile: concurrent scans share the context, so each needs its own page
+                page = await context.new_page()
+                try:
+                    yield page
+                finally:
+                    await page.close()
+                return
+                
+            page = self._context_pages.get(context)
+            if page is None:
+                page = self._context_pages[context] = await context.new_page()
+            yield page
+            
+    async def _detect_blocking_mechanisms(self, page: Optional[Page] = None) -> List[str]:
         """Detect TikTok's blocking mechanisms."""
+        page = page or self.page
         errors = []
         
-        if not self.page:
+        if not page:
             return ["Browser not initialized"]
             
         try:
-            # Check for login wall
-            login_elements = await self.page.query_selector_all('[data-e2e="login-button"], [data-e2e="modal-login"], .login-container')
-            if login_elements:
-                errors.append("Login wall detected")
-                
-            # Check for rate limiting messages
-            rate_limit_elements = await self.page.query_selector_all('text=/too.many.requests|rate.limited|try.again.later/i')
-            if rate_limit_elements:
-                errors.append("Rate limiting detected")
-                
-            # Check for challenge/captcha
-            challenge_elements = await self.page.query_selector_all('[data-e2e="captcha"], .captcha-container, text=/verify|challenge|captcha/i')
-            if challenge_elements:
-                errors.append("Challenge/captcha detected")
-                
-            # Check for private profile
-            private_elements = await self.page.query_selector_all('text=/private.account|follow.to.see|this.account.is.private/i')
-            if private_elements:
-                errors.append("Private profile detected")
-                
-            # Check for 404/not found
-            not_found_elements = await self.page.query_selector_all('text=/user.not.found|page.not.available|couldn.t.find/i')
-            if not_found_elements:
-                errors.append("Profile not found (404)")
+            # One round-trip fetches structural flags and the page text
+            snapshot = await page.evaluate(BLOCKING_PROBE_JS) or {}
+            text = snapshot.get('text') or ''
+            signals = {
+                'login': snapshot.get('login'),
+                'rate_limited': RATE_LIMIT_RE.search(text),
+                'challenge': snapshot.get('challenge') or CHALLENGE_RE.search(text),
+                'private': PRIVATE_RE.search(text),
+                'not_found': NOT_FOUND_RE.search(text)
+            }
+            errors.extend(message for signal, message in BLOCKING_MESSAGES if signals[signal])
                 
         except Exception as e:
             logger.error(f"Error detecting blocking mechanisms: {e}")
@@ -118,111 +378,54 @@ class TikTokPlaywrightScraper(BaseScraper):
             
         return errors
         
-    async def _extract_profile_data(self, handle: str) -> Optional[RawProfile]:
+    async def _extract_profile_data(self, handle: str, page: Optional[Page] = None) -> Optional[RawProfile]:
         """Extract profile data from TikTok page."""
-        if not self.page:
+        page = page or self.page
+        if not page:
             return None
             
         try:
             # Navigate to profile page
             profile_url = f"https://www.tiktok.com/@{handle}"
-            await self.page.goto(profile_url, wait_until='networkidle', timeout=30000)
+            # TikTok never goes network-idle (video beacons, analytics pings), so
+            # wait for the DOM and then only for the element we actually parse
+            await page.goto(profile_url, wait_until='domcontentloaded', timeout=15000)
             
-            # Wait for profile content to load
-            await self.page.wait_for_selector('[data-e2e="user-info"]', timeout=10000)
+            # Wait for the profile header or a blocking marker, whichever comes first;
+            # on timeout carry on and let the blocking probe / extraction strategies
+            # decide what is there
+            try:
+                await page.wait_for_selector(PROFILE_READY_SELECTOR, timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Profile header did not render for {handle}")
             
             # Check for blocking mechanisms
-            blocking_errors = await self._detect_blocking_mechanisms()
+            blocking_errors = await self._detect_blocking_mechanisms(page)
             if blocking_errors:
                 logger.warning(f"Blocking mechanisms detected for {handle}: {blocking_errors}")
                 return None
             
-            # Extract profile data using multiple strategies
-            profile_data = {}
-            
-            # Strategy 1: Extract from user-info container
-            try:
-                user_info_elements = await self.page.query_selector_all('[data-e2e="user-info"]')
-                if user_info_elements:
-                    # Extract follower count
-                    follower_elements = await self.page.query_selector_all('[data-e2e="followers-count"]')
-                    if follower_elements and len(follower_elements) > 0:
-                        try:
-                            follower_text = await follower_elements[0].inner_text()
-                            profile_data['follower_count'] = self._parse_count(follower_text)
-                        except Exception as e:
-                            logger.debug(f"Failed to extract follower count: {e}")
-                    
-                    # Extract following count
-                    following_elements = await self.page.query_selector_all('[data-e2e="following-count"]')
-                    if following_elements and len(following_elements) > 0:
-                        try:
-                            following_text = await following_elements[0].inner_text()
-                            profile_data['following_count'] = self._parse_count(following_text)
-                        except Exception as e:
-                            logger.debug(f"Failed to extract following count: {e}")
-                    
-                    # Extract likes count (TikTok equivalent of post count)
-                    likes_elements = await self.page.query_selector_all('[data-e2e="likes-count"]')
-                    if likes_elements and len(likes_elements) > 0:
-                        try:
-                            likes_text = await likes_elements[0].inner_text()
-                            profile_data['like_count'] = self._parse_count(likes_text)
-                        except Exception as e:
-                            logger.debug(f"Failed to extract likes count: {e}")
-                        
-            except Exception as e:
-                logger.debug(f"User-info extraction failed: {e}")
-                
-            # Strategy 2: Extract from page structure
-            try:
-                # Look for stats in header or bio section
-                stats_elements = await self.page.query_selector_all('h2[data-e2e="user-subtitle"], div[data-e2e="user-desc"] span')
-                for element in stats_elements:
-                    text = await element.inner_text()
-                    if any(indicator in text.lower() for indicator in ['follower', 'following', 'like']):
-                        # Parse numbers from text
-                        numbers = re.findall(r'[\d,]+\.?\d*[kKmM]?', text)
-                        for number in numbers:
-                            if 'follower' in text.lower():
-                                profile_data['follower_count'] = self._parse_count(number)
-                            elif 'following' in text.lower():
-                                profile_data['following_count'] = self._parse_count(number)
-                            elif 'like' in text.lower():
-                                profile_data['like_count'] = self._parse_count(number)
-                                
-            except Exception as e:
-                logger.debug(f"Stats extraction failed: {e}")
+            # One DOM snapshot feeds every strategy; the most complete ones run
+            # first and the cascade stops as soon as every profile field is filled
+            snapshot = await page.evaluate(PROFILE_SNAPSHOT_JS, PROFILE_SNAPSHOT_SELECTORS)
+            if not isinstance(snapshot, dict):
+                snapshot = {}
                 
-            # Strategy 3: Extract bio and verification
-            try:
-                # Extract bio
-                bio_elements = await self.page.query_selector_all('[data-e2e="user-desc"], .user-bio, h2[data-e2e="user-subtitle"]')
-                if bio_elements:
-                    profile_data['bio'] = await bio_elements[0].inner_text()
+            profile_data = {}
+            for strategy in (
+                self._profile_from_sigi,
+                self._profile_from_user_info,
+                self._profile_from_bio,
+                self._profile_from_stats_text
+            ):
+                profile_data.update(await strategy(page, handle, snapshot))
+                if PROFILE_FIELDS <= profile_data.keys():
+                    break
                     
-                # Check for verification badge
-                verified_elements = await self.page.query_selector_all('[data-e2e="user-verified"], .verified-badge, svg[fill*="verified"]')
-                profile_data['is_verified'] = len(verified_elements) > 0
-                
-            except Exception as e:
-                logger.debug(f"Bio/verification extraction failed: {e}")
-                
-            # Strategy 4: Extract from meta tags
-            try:
-                meta_description = await self.page.get_attribute('meta[property="og:description"]', 'content')
-                if meta_description:
-                    # Parse follower/following counts from meta description
-                    numbers = re.findall(r'([\d,]+)\s+(\w+)', meta_description)
-                    for number, metric in numbers:
-                        number_clean = int(number.replace(',', ''))
-                        if 'follower' in metric.lower():
-                            profile_data['follower_count'] = number_clean
-                        elif 'following' in metric.lower():
-                            profile_data['following_count'] = number_clean
-            except Exception as e:
-                logger.debug(f"Meta extraction failed: {e}")
-                
+            # Always applied last: og:description carries exact counts that replace
+            # the abbreviated ("1.2M") ones the DOM strategies read
+            profile_data.update(await self._profile_from_meta(page, handle, snapshot))
+            
             # Fill in defaults for missing data
             profile_data.setdefault('follower_count', 0)
             profile_data.setdefault('following_count', 0)
@@ -231,7 +434,7 @@ class TikTokPlaywrightScraper(BaseScraper):
             profile_data.setdefault('is_verified', False)
             
             # TikTok uses video count instead of post count
-            profile_data['post_count'] = profile_data.get('like_count', 0)  # Fallback to likes if video count not available
+            profile_data.setdefault('post_count', profile_data['like_count'])  # Fallback to likes if video count not available
             
             # Create RawProfile
             return RawProfile(
@@ -248,45 +451,125 @@ class TikTokPlaywrightScraper(BaseScraper):
             logger.error(f"Failed to extract profile data for {handle}: {e}")
             return None
             
-    def _parse_count(self, text: str) -> int:
-        """Parse TikTok count format (e.g., '1.2K' -> 1200)."""
-        text = text.strip().lower()
+    async def _profile_from_sigi(self, page: Page, handle: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read profile fields from TikTok's server-rendered state blob
+        (SIGI_STATE or __UNIVERSAL_DATA_FOR_REHYDRATION__).
+        Returns an empty dict when the blob is absent or does not contain this user.
+        """
+        try:
+            json_text = snapshot.get('state')
+            if not isinstance(json_text, str):
+                return {}
+            state = json.loads(json_text)
+            
+            if 'UserModule' in state:
+                user_module = state['UserModule']
+                user = user_module['users'][handle]
+                stats = user_module.get('stats', {}).get(handle, user)
+            else:
+                user_info = state['__DEFAULT_SCOPE__']['webapp.user-detail']['userInfo']
+                user, stats = user_info['user'], user_info['stats']
+                
+            return {
+                'follower_count': int(stats['followerCount']),
+                'following_count': int(stats['followingCount']),
+                'like_count': int(stats.get('heartCount', stats.get('heart', 0))),
+                'post_count': int(stats.get('videoCount', 0)),
+                'bio': user.get('signature', ''),
+                'is_verified': bool(user.get('verified', False))
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Hydration state unavailable for {handle}: {e}")
+            return {}
+            
+    async def _profile_from_user_info(self, page: Page, handle: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Strategy: follower/following/likes counters inside the user-info container."""
+        profile_data = {}
+        if not snapshot.get('userInfo'):
+            return profile_data
+            
+        for field, key in (('follower_count', 'followers'), ('following_count', 'following'), ('like_count', 'likes')):
+            text = snapshot.get(key)
+            if isinstance(text, str):
+                profile_data[field] = self._parse_count(text)
+                
+        return profile_data
         
-        # Remove commas and extra whitespace
-        text = text.replace(',', '').strip()
+    async def _profile_from_bio(self, page: Page, handle: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Strategy: bio text and verification badge."""
+        profile_data = {'is_verified': bool(snapshot.get('verified'))}
+        if isinstance(snapshot.get('bio'), str):
+            profile_data['bio'] = snapshot['bio']
+        return profile_data
         
-        # Handle K, M, B suffixes
-        if text.endswith('k'):
-            return int(float(text[:-1]) * 1000)
-        elif text.endswith('m'):
-            return int(float(text[:-1]) * 1000000)
-        elif text.endswith('b'):
-            return int(float(text[:-1]) * 1000000000)
+    async def _profile_from_stats_text(self, page: Page, handle: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Strategy: counts parsed out of subtitle/description text."""
+        profile_data = {}
+        for text in snapshot.get('statsTexts') or []:
+            if not isinstance(text, str):
+                continue
+            lowered = text.lower()
+            if any(indicator in lowered for indicator in ['follower', 'following', 'like']):
+                # Parse numbers from text
+                numbers = STATS_NUMBER_RE.findall(text)
+                for number in numbers:
+                    if 'follower' in lowered:
+                        profile_data['follower_count'] = self._parse_count(number)
+                    elif 'following' in lowered:
+                        profile_data['following_count'] = self._parse_count(number)
+                    elif 'like' in lowered:
+                        profile_data['like_count'] = self._parse_count(number)
+                        
+        return profile_data
         
-        # Try to parse as plain number
+    async def _profile_from_meta(self, page: Page, handle: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Strategy: exact follower/following counts from the og:description meta tag."""
+        profile_data = {}
         try:
-            return int(float(text))
-        except ValueError:
-            return 0
+            meta_description = snapshot.get('ogDescription')
+            if meta_description:
+                # Parse follower/following counts from meta description
+                numbers = META_COUNT_RE.findall(meta_description)
+                for number, metric in numbers:
+                    number_clean = int(number.replace(',', ''))
+                    if 'follower' in metric.lower():
+                        profile_data['follower_count'] = number_clean
+                    elif 'following' in metric.lower():
+                        profile_data['following_count'] = number_clean
+        except Exception as e:
+            logger.debug(f"Meta extraction failed: {e}")
             
-    async def _extract_posts(self, profile: RawProfile, limit: int = 12) -> List[RawPost]:
+        return profile_data
+        
+    def _parse_count(self, text: str) -> int:
+        """Parse TikTok count format (e.g., '1.2K' -> 1200)."""
+        return parse_count(text)
+            
+    async def _extract_posts(self, profile: RawProfile, limit: int = 12, page: Optional[Page] = None) -> List[RawPost]:
         """Extract recent videos from TikTok profile page."""
+        page = page or self.page
         posts = []
         
-        if not self.page:
+        if not page:
             return posts
             
         try:
             # Scroll to load videos
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_selector(POST_ITEM_SELECTOR, timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"No video grid rendered for {profile.handle}")
             
-            # Look for video links
-            video_links = await self.page.query_selector_all('[data-e2e="user-post-item"] a, a[href*="/video/"]')
+            # Pull href and engagement texts for every video in one round-trip
+            video_items = await page.eval_on_selector_all(POST_LINK_SELECTOR, VIDEO_ITEMS_JS, limit)
             
-            for i, link in enumerate(video_links[:limit]):
+            # Placeholder timestamps (one day apart) share a single clock read
+            now = datetime.utcnow()
+            for i, item in enumerate(video_items):
                 try:
-                    post_url = await link.get_attribute('href')
+                    post_url = item.get('href')
                     if not post_url:
                         continue
                         
@@ -298,7 +581,7 @@ class TikTokPlaywrightScraper(BaseScraper):
                     post_data = {
                         'id': f"video_{profile.handle}_{i}",
                         'url': post_url,
-                        'timestamp': datetime.utcnow() - timedelta(days=i),
+                        'timestamp': now - timedelta(days=i),
                         'like_count': 0,
                         'comment_count': 0,
                         'share_count': 0,
@@ -307,24 +590,21 @@ class TikTokPlaywrightScraper(BaseScraper):
                         'is_video': True
                     }
                     
-                    # Try to extract engagement data from the video element
-                    try:
-                        # Look for engagement indicators (likes, comments, shares, views)
-                        engagement_elements = await link.query_selector_all('[data-e2e="video-like-count"], [data-e2e="video-comment-count"], [data-e2e="video-share-count"], [data-e2e="video-view-count"], span[class*="like"], span[class*="comment"], span[class*="share"], span[class*="view"]')
-                        
-                        for element in engagement_elements:
-                            text = await element.inner_text()
-                            if any(indicator in text.lower() for indicator in ['like', '❤', '♥']):
-                                post_data['like_count'] = self._parse_count(text)
-                            elif any(indicator in text.lower() for indicator in ['comment', '💬']):
-                                post_data['comment_count'] = self._parse_count(text)
-                            elif any(indicator in text.lower() for indicator in ['share', '↗']):
-                                post_data['share_count'] = self._parse_count(text)
-                            elif any(indicator in text.lower() for indicator in ['view', 'play']):
-                                post_data['view_count'] = self._parse_count(text)
-                                
-                    except Exception as e:
-                        logger.debug(f"Failed to extract engagement for video {i}: {e}")
+                    # Classify engagement indicators (likes, comments, shares, views)
+                    for text in item.get('stats') or []:
+                        lowered = text.lower()
+                        match = COUNT_TOKEN_RE.search(lowered)
+                        if not match:
+                            continue
+                        count = self._parse_count(match.group())
+                        if any(indicator in lowered for indicator in ['like', '❤', '♥']):
+                            post_data['like_count'] = count
+                        elif any(indicator in lowered for indicator in ['comment', '💬']):
+                            post_data['comment_count'] = count
+                        elif any(indicator in lowered for indicator in ['share', '↗']):
+                            post_data['share_count'] = count
+                        elif any(indicator in lowered for indicator in ['view', 'play']):
+                            post_data['view_count'] = count
                         
                     # Create RawPost (TikTok videos are posts)
                     posts.append(RawPost(
@@ -349,62 +629,56 @@ class TikTokPlaywrightScraper(BaseScraper):
             
         return posts
         
-    async def _extract_comments(self, post: RawPost, limit: int = 50) -> List[RawComment]:
+    async def _extract_comments(self, post: RawPost, limit: int = 50, page: Optional[Page] = None) -> List[RawComment]:
         """Extract comments from a specific TikTok video."""
-        comments = []
-        
-        if not self.page:
-            return comments
+        page = page or self.page
+        if not page:
+            return []
+            
+        # The JSON endpoint TikTok's own frontend uses is one request, no render
+        api_comments = await self._extract_comments_api(post, limit, page)
+        if api_comments is not None:
+            return api_comments
             
+        return await self._extract_comments_dom(post, limit, page)
+        
+    async def _extract_comments_dom(self, post: RawPost, limit: int, page: Page) -> List[RawComment]:
+        """Render the video page on `page` and read its comment list."""
+        comments = []
         try:
             # Navigate to video page
-            await self.page.goto(post.url, wait_until='networkidle', timeout=30000)
+            await page.goto(post.url, wait_until='commit')
             
-            # Wait for comments to load
-            await self.page.wait_for_selector('[data-e2e="video-comment"]', timeout=10000)
+            # Wait for comments to load; a timeout usually means they are disabled
+            try:
+                await page.wait_for_selector(COMMENT_READY_SELECTOR, timeout=8000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Comment list did not render for video {post.id}")
             
             # Check if comments are disabled
-            disabled_elements = await self.page.query_selector_all('text=/comments.disabled|no.comments|comments.off/i')
-            if disabled_elements:
+            body_text = await page.evaluate(BODY_TEXT_JS) or ''
+            if COMMENTS_DISABLED_RE.search(body_text):
                 logger.info(f"Comments disabled for video {post.id}")
                 return comments
                 
-            # Look for comment elements
-            comment_elements = await self.page.query_selector_all('[data-e2e="video-comment"], [data-e2e="comment-item"], div[class*="comment"]')
+            # Pull text and author for every comment in one round-trip
+            comment_items = await page.eval_on_selector_all(COMMENT_ITEM_SELECTOR, COMMENT_ITEMS_JS, limit)
             
-            for i, comment_element in enumerate(comment_elements[:limit]):
+            for i, item in enumerate(comment_items):
                 try:
-                    # Extract comment text
-                    text_elements = await comment_element.query_selector_all('[data-e2e="comment-text"], span[class*="text"], div[class*="text"]')
-                    comment_text = ""
-                    if text_elements and len(text_elements) > 0:
-                        for text_element in text_elements:
-                            try:
-                                text = await text_element.inner_text()
-                                if text and len(text) > 2:  # Filter out very short text
-                                    comment_text = text
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Failed to extract comment text: {e}")
-                                continue
-                            
+                    comment_text = item.get('text')
                     if not comment_text:
                         continue
                         
                     # Extract author
-                    author_elements = await comment_element.query_selector_all('[data-e2e="comment-username"], a[href*="/@"], h3, h4')
                     author_id = "unknown"
-                    if author_elements and len(author_elements) > 0:
-                        try:
-                            author_href = await author_elements[0].get_attribute('href')
-                            if author_href:
-                                # Extract username from TikTok URL format
-                                author_id = author_href.strip('/@').split('/')[0] if '/@' in author_href else f"user_{i}"
-                            else:
-                                author_text = await author_elements[0].inner_text()
-                                author_id = author_text.strip('@').split()[0]
-                        except Exception as e:
-                            logger.debug(f"Failed to extract author: {e}")
+                    author_href = item.get('authorHref')
+                    author_text = item.get('authorText')
+                    if author_href:
+                        # Extract username from TikTok URL format
+                        author_id = author_href.strip('/@').split('/')[0] if '/@' in author_href else f"user_{i}"
+                    elif author_text and author_text.strip('@').split():
+                        author_id = author_text.strip('@').split()[0]
                             
                     # Create RawComment
                     comments.append(RawComment(
@@ -425,32 +699,78 @@ class TikTokPlaywrightScraper(BaseScraper):
             
         return comments
         
-    async def _log_scrape_metadata(self, handle: str, errors: List[str], data_completeness: DataCompleteness):
+    async def _extract_comments_api(self, post: RawPost, limit: int, page: Page) -> Optional[List[RawComment]]:
+        """
+        Fetch comments from TikTok's comment list API, reusing the cookies the
+        profile navigation already set on this page's context.
+        Returns None when the API is unusable so the caller falls back to the DOM.
+        """
+        match = VIDEO_ID_RE.search(post.url)
+        if not match:
+            return None
+            
+        try:
+            response = await page.context.request.get(
+                COMMENT_API_URL, params={'aweme_id': match.group(1), 'count': limit, 'cursor': 0}
+            )
+            if not response.ok:
+                logger.debug(f"Comment API returned HTTP {response.status} for video {post.id}")
+                return None
+            data = await response.json()
+        except Exception as e:
+            logger.debug(f"Comment API request failed for video {post.id}: {e}")
+            return None
+            
+        if not isinstance(data, dict) or data.get('status_code') != 0:
+            return None
+            
+        # A missing or null list is not "no comments" (that is an empty list);
+        # let the DOM fallback decide
+        items = data.get('comments')
+        if not isinstance(items, list):
+            return None
+            
+        comments = []
+        for item in items[:limit]:
+            try:
+                comments.append(RawComment(
+                    id=str(item['cid']),
+                    text=item['text'],
+                    timestamp=datetime.utcfromtimestamp(item['create_time']),
+                    author_id=(item.get('user') or {}).get('unique_id') or "unknown",
+                    like_count=item.get('digg_count', 0),
+                    reply_count=item.get('reply_comment_total', 0)
+                ))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed API comment on video {post.id}: {e}")
+                
+        return comments
+        
+    async def _log_scrape_metadata(self, handle: str, errors: List[str], data_completeness: DataCompleteness,
+                                   session_id: Optional[str] = None, cache_hit: bool = False):
         """Log structured scrape metadata."""
+        now = datetime.utcnow()
         log_entry = {
             'handle': handle,
             'platform': 'tiktok',
-            'scraped_at': datetime.utcnow().isoformat(),
-            'ip_session': self.session_metadata.get('session_id', 'unknown'),
+            'scraped_at': now,
+            'ip_session': session_id or self.session_metadata.get('session_id', 'unknown'),
             'browser_version': self.session_metadata.get('browser_version', 'unknown'),
             'failure_reason': errors[0] if errors else None,
             'data_completeness': data_completeness.value,
+            'cache_hit': cache_hit,
             'session_metadata': self.session_metadata
         }
         
-        # Ensure logs directory exists
-        import os
-        logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
-        os.makedirs(logs_dir, exist_ok=True)
-        
-        # Write log entry
-        log_file = os.path.join(logs_dir, f'tiktok_scrape_{datetime.utcnow().strftime("%Y%m%d")}.jsonl')
+        await scrape_log_writer.write(self._get_log_file(now), log_entry)
         
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
-        except Exception as e:
-            logger.error(f"Failed to write scrape metadata log: {e}")
+    def _get_log_file(self, now: datetime) -> Path:
+        """Return today's log path, rebuilding it only when the UTC date rolls over."""
+        today = now.date()
+        if today != self._log_date:
+            self._log_date = today
+            self._log_file = SCRAPE_LOG_DIR / f'tiktok_scrape_{today:%Y%m%d}.jsonl'
+        return self._log_file
             
     async def scrape_profile(self, handle: str) -> Optional[RawProfile]:
         """Scrape TikTok profile data."""
@@ -467,72 +787,135 @@ class TikTokPlaywrightScraper(BaseScraper):
         """Scrape comments from a specific TikTok video."""
         return await self._extract_comments(post, limit)
         
+    async def _cached_scan(self, handle: str) -> Optional[ScrapeResult]:
+        """Return a recent scan of `handle` from the shared cache (marked ARCHIVAL), logging the hit."""
+        cached = scan_cache.get(self.platform, handle)
+        if cached is not None:
+            await self._log_scrape_metadata(handle, cached.errors, cached.data_completeness, cache_hit=True)
+        return cached
+        
     async def run_scan(self, handle: str) -> ScrapeResult:
         """Run complete scan: profile, videos, and comments."""
-        errors = []
-        completeness = DataCompleteness.FULL
-        
+        # Repeat queries within the cache TTL never touch the browser
+        cached = await self._cached_scan(handle)
+        if cached is not None:
+            return cached
+            
         # Initialize browser if needed
         if not self.page:
             try:
                 await self._setup_browser()
             except Exception as e:
-                errors.append(f"Browser initialization failed: {str(e)}")
+                errors = [f"Browser initialization failed: {str(e)}"]
                 await self._log_scrape_metadata(handle, errors, DataCompleteness.FAILED)
                 return ScrapeResult(
                     data_completeness=DataCompleteness.FAILED,
                     errors=errors
                 )
                 
-        # Generate session ID for logging
-        self.session_metadata['session_id'] = f"{handle}_{int(time.time())}"
+        return await self._scan_handle(handle, self.page)
+        
+    async def run_scan_many(self, handles: List[str]) -> List[ScrapeResult]:
+        """
+        Scan several handles concurrently on one browser.
+        Each handle borrows a pooled BrowserContext and its page, so at most
+        CONTEXT_POOL_SIZE scans are in flight and none of them share a page.
+        Results are returned in the same order as `handles`.
+        """
+        if not self.context:
+            try:
+                await self._setup_browser()
+            except Exception as e:
+                errors = [f"Browser initialization failed: {str(e)}"]
+                for handle in handles:
+                    await self._log_scrape_metadata(handle, errors, DataCompleteness.FAILED)
+                return [
+                    ScrapeResult(data_completeness=DataCompleteness.FAILED, errors=list(errors))
+                    for _ in handles
+                ]
+                
+        async def scan_one(handle: str) -> ScrapeResult:
+            cached = await self._cached_scan(handle)
+            if cached is not None:
+                return cached
+            async with self._acquire_page() as page:
+                return await self._scan_handle(handle, page)
+                    
+        return await asyncio.gather(*(scan_one(handle) for handle in handles))
+        
+    async def _scan_handle(self, handle: str, page: Page) -> ScrapeResult:
+        """Profile, videos and comments for one handle, driven entirely through `page`."""
+        errors = []
+        completeness = DataCompleteness.FULL
+        session_id = f"{handle}_{int(time.time())}"
         
+        # Circuit breaker: while TikTok is actively blocking this session, every
+        # further page load would just re-trigger the same wall. The account
+        # itself was never checked, so report a retryable failure, not UNAVAILABLE
+        # (which means private or deleted)
+        remaining = self._blocked_until - time.monotonic()
+        if remaining > 0:
+            errors.append(f"Circuit open (rate limited) after blocking detected; retry in {int(remaining) + 1}s")
+            await self._log_scrape_metadata(handle, errors, DataCompleteness.FAILED, session_id)
+            return ScrapeResult(
+                data_completeness=DataCompleteness.FAILED,
+                errors=errors
+            )
+            
         # 1. Profile
         profile = None
         try:
-            profile = await self.scrape_profile(handle)
+            profile = await self._extract_profile_data(handle, page)
         except Exception as e:
             errors.append(f"Profile extraction error: {str(e)}")
             logger.error(f"Profile extraction failed for {handle}: {e}")
             
         if not profile:
-            blocking_errors = await self._detect_blocking_mechanisms()
+            blocking_errors = await self._detect_blocking_mechanisms(page)
             if blocking_errors:
                 errors.extend(blocking_errors)
                 completeness = DataCompleteness.UNAVAILABLE
+                if CIRCUIT_BREAKING_ERRORS.intersection(blocking_errors):
+                    self._trip_circuit(page)
             else:
                 errors.append("Profile not found or extraction failed")
                 completeness = DataCompleteness.FAILED
                 
-            await self._log_scrape_metadata(handle, errors, completeness)
+            await self._log_scrape_metadata(handle, errors, completeness, session_id)
             return ScrapeResult(
                 data_completeness=completeness,
                 errors=errors
             )
             
+        self._block_strikes = 0
+        
         # 2. Videos (TikTok posts)
         posts = []
         try:
-            posts = await self.scrape_posts(profile)
+            posts = await self._extract_posts(profile, page=page)
             if not posts and profile.post_count > 0:
                 errors.append("No videos extracted despite profile showing videos")
-                completeness = DataCompleteness.PARTIAL_NO_POSTS
+                completeness = DataCompleteness.PARTIAL_NO_COMMENTS
         except Exception as e:
             errors.append(f"Video extraction error: {str(e)}")
             if profile.post_count > 0:
-                completeness = DataCompleteness.PARTIAL_NO_POSTS
+                completeness = DataCompleteness.PARTIAL_NO_COMMENTS
                 
-        # 3. Comments
+        # 3. Comments (fanned out across videos, bounded by a semaphore)
         all_comments = []
         comments_blocked_count = 0
         
-        for post in posts:
-            try:
-                post_comments = await self.scrape_comments(post)
-                all_comments.extend(post_comments)
-            except Exception as e:
-                logger.debug(f"Comment extraction failed for video {post.id}: {e}")
+        semaphore = asyncio.Semaphore(COMMENT_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._scrape_video_comments(post, page, semaphore) for post in posts),
+            return_exceptions=True
+        )
+        for post, result in zip(posts, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Comment extraction failed for video {post.id}: {result}")
                 comments_blocked_count += 1
+            else:
+                all_comments.extend(result)
                 
         # Update completeness based on comment availability
         if comments_blocked_count == len(posts) and len(posts) > 0:
@@ -543,31 +926,77 @@ class TikTokPlaywrightScraper(BaseScraper):
             errors.append(f"Comments blocked on {comments_blocked_count} videos")
             
         # Log scrape metadata
-        await self._log_scrape_metadata(handle, errors, completeness)
+        await self._log_scrape_metadata(handle, errors, completeness, session_id)
         
-        return ScrapeResult(
+        result = ScrapeResult(
             profile=profile,
             posts=posts,
             comments=all_comments,
             data_completeness=completeness,
             errors=errors
         )
+        scan_cache.put(self.platform, handle, result)
+        return result
         
+    def _trip_circuit(self, page: Page):
+        """Open the circuit with exponential backoff and retire the page's context if pooled."""
+        if page.context in self._pooled_contexts:
+            self._retired_contexts.add(page.context)
+            
+        if time.monotonic() < self._blocked_until:
+            return  # concurrent scans hitting the same wall count as one strike
+            
+        backoff = min(CIRCUIT_BASE_BACKOFF * 2 ** self._block_strikes, CIRCUIT_MAX_BACKOFF)
+        self._block_strikes += 1
+        self._blocked_until = time.monotonic() + backoff
+        logger.warning(f"TikTok blocking detected; pausing scans for {backoff:.0f}s")
+        
+    async def _scrape_video_comments(self, post: RawPost, page: Page, semaphore: asyncio.Semaphore,
+                                     limit: int = 50) -> List[RawComment]:
+        """
+        Scrape one video's comments, trying the comment API first. Only the DOM
+        fallback needs a sibling page in the scan's context, so one is opened
+        just for that; videos still load concurrently without borrowing another
+        pooled context.
+        """
+        async with semaphore:
+            # The API only uses the context's request client, not a page of its own
+            api_comments = await self._extract_comments_api(post, limit, page)
+            if api_comments is not None:
+                return api_comments
+                
+            video_page = await page.context.new_page()
+            try:
+                return await self._extract_comments_dom(post, limit, video_page)
+            finally:
+                await video_page.close()
+                
     async def cleanup(self):
         """Clean up browser resources."""
+        await scrape_log_writer.flush()
         try:
+            for context in self._pooled_contexts:
+                await context.close()
+            self._pooled_contexts = []
+            self._context_pages = {}
+            self._retired_contexts = set()
+            self._idle_contexts = None
             if self.page:
                 await self.page.close()
             if self.context:
                 await self.context.close()
-            if self.browser:
+            if self.browser and not self._shared_browser:
                 await self.browser.close()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
+        finally:
+            if self._finalizer:
+                self._finalizer.detach()
+                self._finalizer = None
             
-    def __del__(self):
-        """Ensure cleanup on deletion."""
-        try:
-            asyncio.get_event_loop().run_until_complete(self.cleanup())
-        except Exception:
-            pass
\ No newline at end of file
+    async def __aenter__(self):
+        await self._setup_browser()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
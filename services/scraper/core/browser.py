@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint patches installed with one add_init_script call per context: hide
+# navigator.webdriver, stub window.chrome, and give plugins, languages and the
+# notifications permission the values a headed Chrome reports. Wrapped in an IIFE
+# so nothing leaks into the page's global scope.
+STEALTH_JS = """
+(() => {
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    window.chrome = {
+        runtime: {},
+    };
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+
+    const permissions = window.navigator.permissions;
+    if (permissions && permissions.query) {
+        const query = permissions.query.bind(permissions);
+        permissions.query = (parameters) => (
+            parameters && parameters.name === 'notifications'
+                ? Promise.resolve({ state: Notification.permission })
+                : query(parameters)
+        );
+    }
+})();
+"""
+
+# One Playwright driver (a Node subprocess) per event loop, shared by every scraper;
+# only browsers and contexts multiply. Keyed by loop because driver objects are loop-bound.
+_drivers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Playwright]" = weakref.WeakKeyDictionary()
+_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+# Launched Chromium instances per loop, keyed by launch args. Scrapers open their own
+# contexts on these (isolated cookies/storage) instead of paying a browser launch each.
+_browsers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, ...], Browser]]" = weakref.WeakKeyDictionary()
+_browser_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+async def get_playwright() -> Playwright:
+    """Return the shared Playwright driver for the running loop, starting it on first use."""
+    loop = asyncio.get_running_loop()
+    lock = _locks.get(loop)
+    if lock is None:
+        lock = _locks[loop] = asyncio.Lock()
+
+    async with lock:
+        driver = _drivers.get(loop)
+        if driver is None:
+            driver = _drivers[loop] = await async_playwright().start()
+            logger.info("Playwright driver started")
+    return driver
+
+
+async def get_browser(args: Sequence[str]) -> Browser:
+    """
+    Return the running loop's shared headless Chromium for `args`, launching it on
+    first use or after it disconnected. Callers own only the contexts they open on
+    it and must not close the browser itself; stop_playwright() does that.
+    """
+    playwright = await get_playwright()
+    loop = asyncio.get_running_loop()
+    lock = _browser_locks.get(loop)
+    if lock is None:
+        lock = _browser_locks[loop] = asyncio.Lock()
+
+    key = tuple(args)
+    async with lock:
+        browsers = _browsers.setdefault(loop, {})
+        shared = browsers.get(key)
+        if shared is None or not shared.is_connected():
+            shared = browsers[key] = await playwright.chromium.launch(headless=True, args=list(args))
+            logger.info("Shared Chromium launched")
+    return shared
+
+
+async def stop_playwright():
+    """Close the shared browsers and stop the running loop's driver; call once on service shutdown."""
+    loop = asyncio.get_running_loop()
+    browsers = _browsers.pop(loop, {})
+    results = await asyncio.gather(*(shared.close() for shared in browsers.values()), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug(f"Failed to close shared browser: {result}")
+
+    driver: Optional[Playwright] = _drivers.pop(loop, None)
+    if driver:
+        await driver.stop()
+        logger.info("Playwright driver stopped")
+
+
+class PagePool:
+    """
+    Up to `size` long-lived pages over one BrowserContext, shared by concurrent scans.
+    An idle page is handed out without yielding to the event loop; once every page
+    is busy, callers wait on a future that the next release fulfils directly.
+    """
+
+    def __init__(self, context: BrowserContext, size: int):
+        self.context = context
+        self.size = size
+        self._pages: List[Page] = []
+        self._creating = 0
+        self._available: Deque[Page] = deque()
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a page for the duration of the block."""
+        page = await self._get()
+        try:
+            yield page
+        finally:
+            self._release(page)
+
+    async def _get(self) -> Page:
+        if self._available:
+            return self._available.popleft()
+
+        if len(self._pages) + self._creating < self.size:
+            # Reserve the slot before awaiting so concurrent callers don't overshoot `size`
+            self._creating += 1
+            try:
+                page = await self.context.new_page()
+            finally:
+                self._creating -= 1
+            self._pages.append(page)
+            return page
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a page just as we were cancelled; pass it on
+                self._release(waiter.result())
+            raise
+
+    def _release(self, page: Page):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(page)
+                return
+        self._available.append(page)
+
+    async def close(self):
+        """Close every page the pool opened."""
+        results = await asyncio.gather(*(page.close() for page in self._pages), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to close pooled page: {result}")
+        self._pages = []
+        self._available.clear()
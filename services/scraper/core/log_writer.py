@@ -0,0 +1,92 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import aiofiles
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Scrape metadata logs live in services/scraper/logs; created once per process
+SCRAPE_LOG_DIR = Path(__file__).resolve().parent.parent / 'logs'
+SCRAPE_LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _json_default(value: Any) -> str:
+    # Same ISO-8601 text orjson emits natively for naive datetimes
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """
+    Serialize one JSONL record straight to UTF-8 bytes.
+    datetime values may be passed as-is; both encoders write them as ISO-8601.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=_json_default) + '\n').encode('utf-8')
+
+
+class JsonlLogWriter:
+    """
+    Batched, non-blocking JSONL appender for scraper telemetry.
+    Entries are buffered per file and written by a single flush task,
+    so concurrent scans never block the event loop on disk I/O.
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_batch: int = 100):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: Dict[Union[str, Path], List[bytes]] = defaultdict(list)
+        self._pending_count = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def write(self, path: Union[str, Path], entry: Dict[str, Any]):
+        """Queue a log entry for `path`; flushes inline once the batch is full."""
+        self._pending[path].append(_dumps_line(entry))
+        self._pending_count += 1
+
+        if self._pending_count >= self.max_batch:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def flush(self):
+        """Write every buffered entry to disk."""
+        # Swap the buffer out synchronously so entries queued while we
+        # await the file writes land in the next batch.
+        pending, self._pending = self._pending, defaultdict(list)
+        self._pending_count = 0
+
+        for path, lines in pending.items():
+            try:
+                async with aiofiles.open(path, 'ab') as f:
+                    await f.write(b''.join(lines))
+            except Exception as e:
+                logger.error(f"Failed to write scrape metadata log: {e}")
+
+    async def close(self):
+        """Cancel the pending flush timer and write out whatever is buffered; call on shutdown."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self.flush()
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+
+# Process-wide writer shared by all scraper adapters
+scrape_log_writer = JsonlLogWriter()
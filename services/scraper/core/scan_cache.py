@@ -0,0 +1,64 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from shared.schemas.domain import DataCompleteness
+from .types import ScrapeResult
+
+# Seconds a completed scan is served from memory; 0 disables the cache
+SCAN_CACHE_TTL = float(os.getenv('SCRAPER_CACHE_TTL', '60'))
+SCAN_CACHE_SIZE = 1024
+
+class ScanCache:
+    """
+    Process-wide cache of recent scan results keyed by (platform, handle).
+    Scrapers are built per request, so without it every repeat query (dashboard
+    refreshes, job retries, audit re-runs) relaunches a browser and rescrapes.
+    Only scans that produced a profile are stored; failures are always retried.
+    get/put never await, so concurrent scans need no lock around them.
+    """
+
+    def __init__(self, ttl: float = SCAN_CACHE_TTL, maxsize: int = SCAN_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, ScrapeResult]]" = OrderedDict()
+
+    @staticmethod
+    def _key(platform: str, handle: str) -> Tuple[str, str]:
+        return str(getattr(platform, 'value', platform)), handle.lower()
+
+    def get(self, platform: str, handle: str) -> Optional[ScrapeResult]:
+        """
+        Return a private copy of the cached scan, or None when absent or expired.
+        Only FULL scans are relabelled ARCHIVAL; partial ones keep their own
+        (lower-confidence) completeness rather than being upgraded by the cache.
+        """
+        key = self._key(platform, handle)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        cached = result.model_copy(deep=True)
+        if cached.data_completeness == DataCompleteness.FULL:
+            cached.data_completeness = DataCompleteness.ARCHIVAL
+        return cached
+
+    def put(self, platform: str, handle: str, result: ScrapeResult):
+        """Store a scan that produced a profile, evicting the oldest entry when full."""
+        if self.ttl <= 0 or result.profile is None:
+            return
+        key = self._key(platform, handle)
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+# Shared by all scraper instances in the process
+scan_cache = ScanCache()
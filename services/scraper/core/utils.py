@@ -0,0 +1,25 @@
+import re
+from functools import lru_cache
+
+# Number with optional K/M/B suffix, after commas are stripped
+_COUNT_RE = re.compile(r'^(\d*\.?\d+)\s*([kmb]?)$')
+_MULT = {'': 1, 'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000}
+
+
+@lru_cache(maxsize=4096)
+def parse_count(text: str) -> int:
+    """
+    Parses abbreviated platform counts (e.g. '1.2K' -> 1200, '1,234' -> 1234).
+    Returns 0 for anything unparseable.
+    Memoized: the same few spans ('1.2K', '10') repeat across posts and scans.
+    """
+    # Plain ASCII integers (most raw API counts) skip the normalisation and regex
+    if text.isascii() and text.isdigit():
+        return int(text)
+
+    match = _COUNT_RE.match(text.strip().lower().replace(',', ''))
+    if not match:
+        return 0
+
+    number, suffix = match.groups()
+    return int(float(number) * _MULT[suffix])
@@ -0,0 +1,28 @@
+import asyncio
+import pytest
+from services.scraper.core.scan_cache import scan_cache
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def pytest_configure(config):
+    """Run the scraper's async tests on uvloop when installed (it has no Windows build)."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_unconfigure(config):
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(None)
+
+
+@pytest.fixture(autouse=True)
+def clear_scan_cache():
+    """Keep scans from one test from being served to the next out of the shared cache."""
+    scan_cache.clear()
+    yield
+    scan_cache.clear()
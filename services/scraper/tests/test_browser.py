@@ -0,0 +1,127 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from services.scraper.core import browser
+
+
+class TestSharedPlaywright:
+    """Unit tests for the process-wide Playwright driver."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_driver(self):
+        """Test the driver is started once however many scrapers ask for it."""
+        driver = MagicMock()
+        driver.stop = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.start = AsyncMock(return_value=driver)
+
+        with patch.object(browser, 'async_playwright', factory):
+            drivers = await asyncio.gather(*(browser.get_playwright() for _ in range(5)))
+            await browser.stop_playwright()
+
+        assert all(d is driver for d in drivers)
+        factory.return_value.start.assert_awaited_once()
+        driver.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scrapers_share_one_launched_browser(self):
+        """Test Chromium is launched once per set of launch args and closed on shutdown."""
+        shared = MagicMock()
+        shared.is_connected = MagicMock(return_value=True)
+        shared.close = AsyncMock()
+        driver = MagicMock()
+        driver.chromium.launch = AsyncMock(return_value=shared)
+        driver.stop = AsyncMock()
+
+        with patch.object(browser, 'get_playwright', AsyncMock(return_value=driver)):
+            browsers = await asyncio.gather(*(browser.get_browser(['--disable-gpu']) for _ in range(5)))
+        browser._drivers[asyncio.get_running_loop()] = driver
+        await browser.stop_playwright()
+
+        assert all(b is shared for b in browsers)
+        driver.chromium.launch.assert_awaited_once_with(headless=True, args=['--disable-gpu'])
+        shared.close.assert_awaited_once()
+        driver.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_relaunched(self):
+        """Test a crashed shared browser is replaced on the next request."""
+        dead, alive = MagicMock(), MagicMock()
+        dead.is_connected = MagicMock(return_value=False)
+        alive.close = AsyncMock()
+        driver = MagicMock()
+        driver.chromium.launch = AsyncMock(side_effect=[dead, alive])
+
+        with patch.object(browser, 'get_playwright', AsyncMock(return_value=driver)):
+            assert await browser.get_browser([]) is dead
+            assert await browser.get_browser([]) is alive
+        await browser.stop_playwright()
+
+    @pytest.mark.asyncio
+    async def test_stop_without_driver_is_noop(self):
+        """Test shutdown is safe when no scraper ever started a browser."""
+        await browser.stop_playwright()
+
+
+class TestPagePool:
+    """Unit tests for the shared page pool."""
+
+    @pytest.fixture
+    def context(self):
+        context = MagicMock()
+        context.new_page = AsyncMock(side_effect=lambda: AsyncMock())
+        return context
+
+    @pytest.mark.asyncio
+    async def test_pages_created_lazily_up_to_size(self, context):
+        """Test concurrent acquirers never open more than `size` pages."""
+        pool = browser.PagePool(context, size=2)
+        seen = []
+
+        async def scan():
+            async with pool.acquire() as page:
+                seen.append(page)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(scan() for _ in range(6)))
+
+        assert context.new_page.await_count == 2
+        assert len({id(page) for page in seen}) == 2
+
+    @pytest.mark.asyncio
+    async def test_released_page_goes_to_oldest_waiter(self, context):
+        """Test a released page is handed straight to the first queued acquirer."""
+        pool = browser.PagePool(context, size=1)
+        order = []
+
+        async def scan(name):
+            async with pool.acquire():
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(scan(name) for name in "abc"))
+
+        assert order == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self, context):
+        """Test a waiter cancelled while queued does not swallow the next page."""
+        pool = browser.PagePool(context, size=1)
+        async with pool.acquire() as page:
+            waiting = asyncio.create_task(pool._get())
+            await asyncio.sleep(0)
+            waiting.cancel()
+
+        async with pool.acquire() as again:
+            assert again is page
+
+    @pytest.mark.asyncio
+    async def test_close_closes_every_page(self, context):
+        """Test closing the pool closes each page it opened."""
+        pool = browser.PagePool(context, size=2)
+        async with pool.acquire() as first, pool.acquire() as second:
+            pass
+        await pool.close()
+
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
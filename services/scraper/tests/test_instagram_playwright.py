@@ -4,8 +4,13 @@ import json
 import os
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from shared.schemas.domain import Platform, DataCompleteness
 from shared.schemas.raw import RawProfile, RawPost, RawComment
+from services.scraper.core.browser import PagePool
+from services.scraper.core.log_writer import scrape_log_writer
+from services.scraper.core.scan_cache import scan_cache
+from services.scraper.core.types import ScrapeResult
 from services.scraper.adapters.instagram_playwright import InstagramPlaywrightScraper
 
 
@@ -18,11 +23,20 @@ class TestInstagramPlaywrightScraper:
         return InstagramPlaywrightScraper()
         
     @pytest.fixture
-    def mock_page(self):
+    def mock_cdp(self):
+        """Create mock CDP session answering Runtime.evaluate with an empty snapshot."""
+        cdp = AsyncMock()
+        cdp.send = AsyncMock(return_value={'result': {'value': {}}})
+        return cdp
+        
+    @pytest.fixture
+    def mock_page(self, mock_cdp):
         """Create mock page object."""
         page = AsyncMock()
+        page.context.new_cdp_session = AsyncMock(return_value=mock_cdp)
         page.goto = AsyncMock()
         page.wait_for_selector = AsyncMock()
+        page.query_selector = AsyncMock(return_value=None)
         page.query_selector_all = AsyncMock(return_value=[])
         page.get_attribute = AsyncMock(return_value=None)
         page.inner_text = AsyncMock(return_value="")
@@ -30,12 +44,15 @@ class TestInstagramPlaywrightScraper:
         return page
         
     @pytest.fixture
-    def mock_browser_context(self, mock_page):
+    def mock_browser_context(self, mock_page, mock_cdp):
         """Create mock browser context."""
         context = AsyncMock()
+        context.new_cdp_session = AsyncMock(return_value=mock_cdp)
         context.new_page = AsyncMock(return_value=mock_page)
         context.add_init_script = AsyncMock()
+        context.route = AsyncMock()
         context.close = AsyncMock()
+        mock_page.context = context
         return context
         
     @pytest.fixture
@@ -55,86 +72,63 @@ class TestInstagramPlaywrightScraper:
         pw.chromium.launch = AsyncMock(return_value=mock_browser)
         return pw
         
+    @pytest.fixture
+    def page_pool(self, mock_browser_context):
+        """Pool of pages over the mock context, handed to run_scan instead of launching a browser."""
+        return PagePool(mock_browser_context, size=2)
+        
+    @pytest.mark.parametrize("snapshot, expected", [
+        ({'login': True}, "Login wall detected"),
+        ({'text': "Too many requests. Please try again later."}, "Rate limiting detected"),
+        ({'challenge': True}, "Challenge/captcha detected"),
+        ({'text': "This account is private"}, "Private profile detected"),
+        ({'text': "Sorry, we couldn't find this account."}, "Profile not found (404)"),
+    ])
     @pytest.mark.asyncio
-    async def test_login_wall_detection(self, scraper, mock_page):
-        """Test detection of login wall."""
-        # Mock login form elements
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [MagicMock()],  # Login elements found
-            [],  # No rate limiting
-            [],  # No challenge
-            [],  # Not private
-            []   # Not 404
-        ])
+    async def test_blocking_detection(self, scraper, mock_page, mock_cdp, snapshot, expected):
+        """Test each blocking mechanism is reported from the page snapshot."""
+        mock_cdp.send = AsyncMock(return_value={'result': {'value': snapshot}})
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
         
-        assert "Login wall detected" in errors
+        assert expected in errors
+        method, params = mock_cdp.send.call_args.args
+        assert method == "Runtime.evaluate"
+        assert params['returnByValue'] is True
+        mock_page.evaluate.assert_not_called()
         
     @pytest.mark.asyncio
-    async def test_rate_limiting_detection(self, scraper, mock_page):
-        """Test detection of rate limiting."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [MagicMock()],  # Rate limiting detected
-            [],  # No challenge
-            [],  # Not private
-            []   # Not 404
-        ])
-        
+    async def test_cdp_session_reused_per_page(self, scraper, mock_page, mock_cdp):
+        """Test the page's CDP session is opened once and reused across probes."""
         scraper.page = mock_page
-        errors = await scraper._detect_blocking_mechanisms()
+        await scraper._detect_blocking_mechanisms()
+        await scraper._goto(mock_page, "https://www.instagram.com/other_user/")
+        await scraper._detect_blocking_mechanisms()
         
-        assert "Rate limiting detected" in errors
+        mock_page.context.new_cdp_session.assert_called_once_with(mock_page)
+        assert mock_cdp.send.call_count == 2
         
     @pytest.mark.asyncio
-    async def test_challenge_captcha_detection(self, scraper, mock_page):
-        """Test detection of challenge/captcha."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [MagicMock()],  # Challenge detected
-            [],  # Not private
-            []   # Not 404
-        ])
-        
+    async def test_blocking_verdict_reused_until_navigation(self, scraper, mock_page, mock_cdp):
+        """Test a blocked scan probes the page once, not again after profile extraction."""
+        mock_cdp.send = AsyncMock(return_value={'result': {'value': {'login': True}}})
         scraper.page = mock_page
-        errors = await scraper._detect_blocking_mechanisms()
-        
-        assert "Challenge/captcha detected" in errors
-        
-    @pytest.mark.asyncio
-    async def test_private_profile_detection(self, scraper, mock_page):
-        """Test detection of private profile."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [],  # No challenge
-            [MagicMock()],  # Private profile detected
-            []   # Not 404
-        ])
         
-        scraper.page = mock_page
-        errors = await scraper._detect_blocking_mechanisms()
+        result = await scraper.run_scan("test_user")
         
-        assert "Private profile detected" in errors
+        assert "Login wall detected" in result.errors
+        assert mock_cdp.send.await_count == 1
         
     @pytest.mark.asyncio
-    async def test_profile_not_found_detection(self, scraper, mock_page):
-        """Test detection of 404/profile not found."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [],  # No challenge
-            [],  # Not private
-            [MagicMock()]  # 404 detected
-        ])
+    async def test_cdp_evaluate_exception_reported(self, scraper, mock_page, mock_cdp):
+        """Test a Runtime.evaluate exception surfaces as a detection error."""
+        mock_cdp.send = AsyncMock(return_value={'exceptionDetails': {'text': "Uncaught"}})
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
         
-        assert "Profile not found (404)" in errors
+        assert errors == ["Detection error: Uncaught"]
         
     @pytest.mark.asyncio
     async def test_comments_disabled_detection(self, scraper, mock_page):
@@ -151,15 +145,17 @@ class TestInstagramPlaywrightScraper:
         )
         
         # Mock comments disabled
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [MagicMock()],  # Comments disabled found
-            []  # No comment elements
-        ])
+        mock_page.evaluate = AsyncMock(return_value={
+            'text': "Comments disabled for this post",
+            'comments': [{'text': "Great post!", 'href': "/someone/", 'author': "someone"}]
+        })
         
         scraper.page = mock_page
-        comments = await scraper._extract_comments(post)
+        comments_by_post = await scraper._extract_comments_batch([post])
         
-        assert len(comments) == 0
+        assert comments_by_post == {"test_post_1": []}
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
         
     @pytest.mark.asyncio
     async def test_parse_count_formats(self, scraper):
@@ -185,61 +181,65 @@ class TestInstagramPlaywrightScraper:
             result = await scraper._extract_profile_data("test_user")
             
         assert result is None
-        
+
     @pytest.mark.asyncio
-    async def test_run_scan_with_login_wall(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_profile_wait_settles_on_login_wall(self, scraper, mock_page):
+        """Test the profile wait also resolves on a blocking marker, not only the header."""
+        mock_page.goto = AsyncMock()
+        mock_page.wait_for_selector = AsyncMock()
+
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=["Login wall detected"]):
+            scraper.page = mock_page
+            await scraper._extract_profile_data("test_user")
+
+        selector = mock_page.wait_for_selector.call_args[0][0]
+        assert 'header' in selector
+        assert 'input[name="username"]' in selector
+        assert '[data-testid="challenge"]' in selector
+
+    @pytest.mark.asyncio
+    async def test_run_scan_with_login_wall(self, scraper, mock_cdp, page_pool):
         """Test complete scan when login wall is encountered."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock blocking detection
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [MagicMock()],  # Login wall detected
-                [], [], [], []
-            ])
-            
-            result = await scraper.run_scan("test_user")
-            
-            assert result.data_completeness == DataCompleteness.UNAVAILABLE
-            assert "Login wall detected" in result.errors
-            assert result.profile is None
+        # Mock blocking detection
+        mock_cdp.send = AsyncMock(return_value={'result': {'value': {'login': True}}})
+        
+        async with page_pool.acquire() as page:
+            result = await scraper.run_scan("test_user", page=page)
             
+        assert result.data_completeness == DataCompleteness.UNAVAILABLE
+        assert "Login wall detected" in result.errors
+        assert result.profile is None
+        assert scraper.browser is None  # pooled page, no browser launched
+        
     @pytest.mark.asyncio
-    async def test_run_scan_with_private_profile(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_run_scan_with_private_profile(self, scraper, mock_cdp, page_pool):
         """Test complete scan when profile is private."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock private profile detection
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [], [], [], [MagicMock()], []  # Private profile detected
-            ])
-            
-            result = await scraper.run_scan("private_user")
-            
-            assert result.data_completeness == DataCompleteness.UNAVAILABLE
-            assert "Private profile detected" in result.errors
-            assert result.profile is None
+        # Mock private profile detection
+        mock_cdp.send = AsyncMock(return_value={'result': {'value': {'text': "This account is private"}}})
+        
+        async with page_pool.acquire() as page:
+            result = await scraper.run_scan("private_user", page=page)
             
+        assert result.data_completeness == DataCompleteness.UNAVAILABLE
+        assert "Private profile detected" in result.errors
+        assert result.profile is None
+        
     @pytest.mark.asyncio
-    async def test_run_scan_with_rate_limiting(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_run_scan_with_rate_limiting(self, scraper, mock_page, page_pool):
         """Test complete scan when rate limited."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock successful profile extraction but rate limiting on posts
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [], [], [], [], []  # No blocking mechanisms
-            ])
-            
-            # Mock profile data extraction
-            mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 posts")
-            
-            with patch.object(scraper, '_extract_posts', side_effect=Exception("Rate limited")):
-                result = await scraper.run_scan("test_user")
-                
-                assert "Post extraction error: Rate limited" in result.errors
+        # Mock successful profile extraction but rate limiting on posts
+        mock_page.evaluate = AsyncMock(return_value={})  # No blocking mechanisms
+        
+        # Mock profile data extraction
+        mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 posts")
+        
+        with patch.object(scraper, '_extract_posts', side_effect=Exception("Rate limited")):
+            async with page_pool.acquire() as page:
+                result = await scraper.run_scan("test_user", page=page)
                 
+            assert "Post extraction error: Rate limited" in result.errors
+            assert result.data_completeness == DataCompleteness.PARTIAL_NO_COMMENTS
+            
     @pytest.mark.asyncio
     async def test_log_scrape_metadata(self, scraper, tmp_path):
         """Test structured logging of scrape metadata."""
@@ -247,14 +247,14 @@ class TestInstagramPlaywrightScraper:
         logs_dir = tmp_path / "logs"
         logs_dir.mkdir()
         
-        with patch('os.path.dirname', return_value=str(tmp_path)), \
-             patch('os.makedirs'):
+        with patch('services.scraper.adapters.instagram_playwright.SCRAPE_LOG_DIR', logs_dir):
             
             await scraper._log_scrape_metadata(
                 "test_user",
                 ["Login wall detected"],
                 DataCompleteness.UNAVAILABLE
             )
+            await scrape_log_writer.flush()
             
             # Check log file was created
             log_files = list(logs_dir.glob("*.jsonl"))
@@ -267,7 +267,7 @@ class TestInstagramPlaywrightScraper:
             assert log_entry['handle'] == "test_user"
             assert log_entry['platform'] == "instagram"
             assert log_entry['failure_reason'] == "Login wall detected"
-            assert log_entry['data_completeness'] == "UNAVAILABLE"
+            assert log_entry['data_completeness'] == DataCompleteness.UNAVAILABLE.value
             
     @pytest.mark.asyncio
     async def test_cleanup_resources(self, scraper, mock_page, mock_browser_context, mock_browser):
@@ -282,44 +282,248 @@ class TestInstagramPlaywrightScraper:
         mock_browser_context.close.assert_called_once()
         mock_browser.close.assert_called_once()
         
+    @pytest.mark.asyncio
+    async def test_cleanup_leaves_shared_browser_running(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright, monkeypatch):
+        """Test cleanup closes only this scraper's context when the browser is the shared one."""
+        monkeypatch.delenv('PW_CDP_ENDPOINT', raising=False)
+        
+        with patch('services.scraper.core.browser.get_playwright', AsyncMock(return_value=mock_playwright)):
+            await scraper._setup_browser()
+            await scraper.cleanup()
+            
+        mock_browser_context.close.assert_called_once()
+        mock_browser.close.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_cleanup_continues_after_page_close_error(self, scraper, mock_page, mock_browser_context, mock_browser):
+        """Test a failing page close still lets the context and browser close."""
+        mock_page.close = AsyncMock(side_effect=Exception("Target closed"))
+        scraper.page = mock_page
+        scraper.context = mock_browser_context
+        scraper.browser = mock_browser
+        
+        await scraper.cleanup()
+        
+        mock_browser_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
+        
+    @pytest.mark.asyncio
+    async def test_async_context_manager_cleans_up(self, scraper, mock_page, mock_browser_context, mock_browser):
+        """Test that leaving the async context closes browser resources."""
+        async def fake_setup():
+            scraper.page = mock_page
+            scraper.context = mock_browser_context
+            scraper.browser = mock_browser
+            
+        with patch.object(scraper, '_setup_browser', side_effect=fake_setup):
+            async with scraper as entered:
+                assert entered is scraper
+                
+        mock_page.close.assert_called_once()
+        mock_browser_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
+        
+    @pytest.mark.asyncio
+    async def test_setup_connects_over_cdp_when_configured(self, scraper, mock_browser, mock_playwright, monkeypatch):
+        """Test that an external browser endpoint is reused instead of launching Chromium."""
+        monkeypatch.setenv('PW_CDP_ENDPOINT', 'http://localhost:9222')
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+        
+        with patch('services.scraper.adapters.instagram_playwright.get_playwright', AsyncMock(return_value=mock_playwright)):
+            await scraper._setup_browser()
+            
+        mock_playwright.chromium.connect_over_cdp.assert_called_once_with('http://localhost:9222')
+        mock_playwright.chromium.launch.assert_not_called()
+        assert scraper.browser is mock_browser
+        
+    @pytest.mark.asyncio
+    async def test_launch_args(self, scraper, mock_browser, mock_browser_context, mock_playwright, monkeypatch):
+        """Test Chromium is launched headless with the resource-saving flags and a desktop viewport."""
+        monkeypatch.delenv('PW_CDP_ENDPOINT', raising=False)
+        
+        with patch('services.scraper.core.browser.get_playwright', AsyncMock(return_value=mock_playwright)):
+            await scraper._setup_browser()
+            
+        launch_kwargs = mock_playwright.chromium.launch.call_args.kwargs
+        assert launch_kwargs['headless'] is True
+        for flag in ('--disable-gpu', '--disable-dev-shm-usage', '--no-sandbox', '--disable-blink-features=AutomationControlled'):
+            assert flag in launch_kwargs['args']
+        assert mock_browser.new_context.call_args.kwargs['viewport'] == {'width': 1366, 'height': 768}
+        mock_browser_context.route.assert_awaited_once()
+        mock_browser_context.add_init_script.assert_awaited_once()
+        stealth_js = mock_browser_context.add_init_script.await_args.args[0]
+        for patched in ('webdriver', 'window.chrome', 'plugins', 'languages', 'permissions'):
+            assert patched in stealth_js
+        
+    @pytest.mark.asyncio
+    async def test_route_filter_blocks_heavy_resources(self):
+        """Test images, media, fonts and stylesheets are aborted while documents and XHR pass."""
+        from services.scraper.adapters.instagram_playwright import _route_filter
+        
+        async def route_for(resource_type):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            route.abort = AsyncMock()
+            route.continue_ = AsyncMock()
+            await _route_filter(route)
+            return route
+            
+        for resource_type in ('image', 'media', 'font', 'stylesheet'):
+            (await route_for(resource_type)).abort.assert_awaited_once()
+        for resource_type in ('document', 'xhr', 'script'):
+            route = await route_for(resource_type)
+            route.continue_.assert_awaited_once()
+            route.abort.assert_not_awaited()
+        
+    @pytest.mark.asyncio
+    async def test_repeat_scan_served_from_cache(self, scraper):
+        """Test a recent scan is returned as ARCHIVAL without launching a browser."""
+        profile = RawProfile(handle="test_user", platform=Platform.INSTAGRAM,
+                             follower_count=1000, following_count=10, post_count=0)
+        scan_cache.put(Platform.INSTAGRAM, "test_user", ScrapeResult(profile=profile, data_completeness=DataCompleteness.FULL))
+        
+        with patch.object(scraper, '_setup_browser') as mock_setup, \
+             patch.object(scraper, '_log_scrape_metadata', new_callable=AsyncMock) as mock_log:
+            result = await scraper.run_scan("test_user")
+            
+        assert result.data_completeness == DataCompleteness.ARCHIVAL
+        assert result.profile == profile
+        mock_setup.assert_not_called()
+        assert mock_log.call_args.kwargs['cache_hit'] is True
+        
     @pytest.mark.asyncio
     async def test_browser_initialization_failure(self, scraper):
         """Test handling of browser initialization failure."""
-        with patch('playwright.async_api.async_playwright', side_effect=Exception("Browser failed")):
+        with patch('services.scraper.adapters.instagram_playwright.get_browser', AsyncMock(side_effect=Exception("Browser failed"))):
             result = await scraper.run_scan("test_user")
             
             assert result.data_completeness == DataCompleteness.FAILED
-            assert "Browser initialization failed" in result.errors
+            assert "Browser initialization failed: Browser failed" in result.errors
             
     @pytest.mark.asyncio
-    async def test_partial_data_extraction(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_partial_data_extraction(self, scraper, mock_page, mock_browser_context, page_pool):
         """Test scan with partial data extraction (some data available)."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
+        # Mock successful profile extraction
+        mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 posts")
+        
+        # Mock some posts but fail on comments
+        with patch.object(scraper, '_extract_posts', return_value=[
+            RawPost(
+                id="post_1",
+                platform=Platform.INSTAGRAM,
+                url="https://instagram.com/p/test1/",
+                timestamp=datetime.utcnow(),
+                like_count=100,
+                comment_count=10,
+                media_urls=[]
+            )
+        ]):
+            with patch.object(scraper, '_extract_comments_batch', side_effect=Exception("Comments blocked")):
+                async with page_pool.acquire() as page:
+                    result = await scraper.run_scan("test_user", page=page)
+                    
+                assert result.profile is not None
+                assert len(result.posts) == 1
+                assert len(result.comments) == 0
+                assert "Comments blocked on all posts" in result.errors
+                assert result.data_completeness == DataCompleteness.PARTIAL_NO_COMMENTS
+                
+            # Posts are read from the already loaded profile page; no second navigation
+            assert mock_page.goto.call_count == 1
+            assert mock_page.goto.call_args.args[0] == "https://www.instagram.com/test_user/"
+            assert scraper._extract_posts.call_args.kwargs['page'] is mock_page
+            assert mock_browser_context.new_page.call_count == 1
+                
+    @pytest.mark.asyncio
+    async def test_comments_scraped_concurrently_on_separate_pages(self, scraper, mock_page, mock_browser_context):
+        """Test that each post's comments are collected on its own page."""
+        scraper.page = mock_page
+        scraper.context = mock_browser_context
+        posts = [
+            RawPost(
+                id=f"post_{i}",
+                platform=Platform.INSTAGRAM,
+                url=f"https://instagram.com/p/test{i}/",
+                timestamp=datetime.utcnow(),
+                like_count=100,
+                comment_count=10,
+                media_urls=[]
+            )
+            for i in range(3)
+        ]
+        profile = RawProfile(
+            handle="test_user",
+            platform=Platform.INSTAGRAM,
+            follower_count=1000,
+            following_count=10,
+            post_count=3
+        )
+        
+        with patch.object(scraper, '_extract_profile_data', return_value=profile), \
+             patch.object(scraper, '_extract_posts', return_value=posts), \
+             patch.object(scraper, '_extract_comments', return_value=[]) as mock_extract:
+            result = await scraper.run_scan("test_user")
+            
+        assert result.data_completeness == DataCompleteness.FULL
+        assert mock_browser_context.new_page.call_count == 3
+        assert mock_page.close.call_count == 3
+        assert all(call.kwargs['page'] is mock_page for call in mock_extract.call_args_list)
+        
+    @pytest.mark.asyncio
+    async def test_run_scan_many_shares_pooled_pages(self, scraper, mock_browser_context):
+        """Test concurrent multi-handle scans each borrow one of a bounded set of pages."""
+        scraper.context = mock_browser_context
+        pages = []
+        
+        async def new_page():
+            page = AsyncMock()
+            pages.append(page)
+            return page
             
-            # Mock successful profile extraction
-            mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 posts")
+        mock_browser_context.new_page = AsyncMock(side_effect=new_page)
+        
+        async def scan(handle, page):
+            await asyncio.sleep(0)
+            return ScrapeResult(data_completeness=DataCompleteness.FULL, errors=[handle])
             
-            # Mock some posts but fail on comments
-            with patch.object(scraper, '_extract_posts', return_value=[
-                RawPost(
-                    id="post_1",
-                    platform=Platform.INSTAGRAM,
-                    url="https://instagram.com/p/test1/",
-                    timestamp=datetime.utcnow(),
-                    like_count=100,
-                    comment_count=10,
-                    media_urls=[]
-                )
-            ]):
-                with patch.object(scraper, '_extract_comments', side_effect=Exception("Comments blocked")):
-                    result = await scraper.run_scan("test_user")
-                    
-                    assert result.profile is not None
-                    assert len(result.posts) == 1
-                    assert len(result.comments) == 0
-                    assert "Comments blocked on 1 posts" in result.errors
-                    
+        with patch('services.scraper.adapters.instagram_playwright.PAGE_POOL_SIZE', 2):
+            with patch.object(scraper, 'run_scan', side_effect=scan) as mock_scan:
+                results = await scraper.run_scan_many(["a", "b", "c", "d"])
+                
+        assert [r.errors for r in results] == [["a"], ["b"], ["c"], ["d"]]
+        assert len(pages) == 2
+        assert {id(call.kwargs['page']) for call in mock_scan.call_args_list} == {id(p) for p in pages}
+        
+        await scraper.cleanup()
+        for page in pages:
+            page.close.assert_awaited_once()
+            
+    @pytest.mark.asyncio
+    async def test_post_count_from_header_stat(self, scraper, mock_page):
+        """Test post count is read from the single header stat element."""
+        post_element = AsyncMock()
+        post_element.inner_text = AsyncMock(return_value="1,024")
+        mock_page.query_selector = AsyncMock(return_value=post_element)
+        
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.post_count == 1024
+        mock_page.query_selector.assert_called_once_with('header li:has-text("post") span')
+        
+    @pytest.mark.asyncio
+    async def test_post_scroll_stops_when_loading_stalls(self, scraper, mock_page):
+        """Test that grid scrolling waits for links and stops once loading stalls."""
+        mock_page.wait_for_function = AsyncMock(side_effect=[None, PlaywrightTimeoutError("stalled")])
+        scraper.page = mock_page
+        
+        await scraper._scroll_for_posts(limit=30)
+        
+        assert mock_page.evaluate.call_count == 2
+        assert [c.kwargs['arg'] for c in mock_page.wait_for_function.call_args_list] == [12, 24]
+        
     @pytest.mark.asyncio
     async def test_empty_profile_data_fallback(self, scraper, mock_page):
         """Test fallback behavior when profile data extraction returns empty."""
@@ -340,4 +544,88 @@ class TestInstagramPlaywrightScraper:
             assert result.following_count == 0
             assert result.post_count == 0
             assert result.bio == ""
-            assert result.is_verified == False
\ No newline at end of file
+            assert result.is_verified is False
+
+    @pytest.mark.asyncio
+    async def test_header_probes_issued_concurrently(self, scraper, mock_page):
+        """Test header selector probes run together and one failing probe does not drop the others."""
+        in_flight = 0
+        peak = 0
+        
+        async def probe(selector):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if 'followers' in selector:
+                raise Exception("detached")
+            if 'Verified' in selector:
+                return [MagicMock()]
+            return []
+            
+        mock_page.query_selector_all = AsyncMock(side_effect=probe)
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert peak >= 4
+        assert result.follower_count == 0
+        assert result.is_verified is True
+        
+    @pytest.mark.asyncio
+    async def test_meta_description_counts(self, scraper, mock_page):
+        """Test every '<n> <metric>' pair in og:description is parsed, including after commas."""
+        mock_page.get_attribute = AsyncMock(return_value="1,234 Followers, 56 Following, 78 Posts - See Instagram photos")
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.follower_count == 1234
+        assert result.following_count == 56
+        assert result.post_count == 78
+        
+    @pytest.mark.asyncio
+    async def test_meta_description_abbreviated_counts(self, scraper, mock_page):
+        """Test K/M suffixed and singular og:description stats are parsed in the same pass."""
+        mock_page.get_attribute = AsyncMock(return_value="1.2M Followers, 1,024 Following, 1 Post - See Instagram photos")
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.follower_count == 1200000
+        assert result.following_count == 1024
+        assert result.post_count == 1
+        
+    @pytest.mark.asyncio
+    async def test_comments_extracted_from_single_evaluate(self, scraper, mock_page):
+        """Test comment text and authors come from one evaluate snapshot per post."""
+        post = RawPost(
+            id="test_post_1",
+            platform=Platform.INSTAGRAM,
+            url="https://instagram.com/p/test/",
+            timestamp=datetime.utcnow(),
+            like_count=100,
+            comment_count=2,
+            media_urls=[]
+        )
+        mock_page.evaluate = AsyncMock(return_value={
+            'text': "Great post! Love it",
+            'comments': [
+                {'text': "Great post!", 'href': "/alice/", 'author': "alice"},
+                {'text': "", 'href': None, 'author': ""},
+                {'text': "Love it", 'href': None, 'author': "@bob replied"}
+            ]
+        })
+        
+        scraper.page = mock_page
+        comments = await scraper._extract_comments(post)
+        
+        assert [c.text for c in comments] == ["Great post!", "Love it"]
+        assert [c.author_id for c in comments] == ["alice", "bob"]
+        assert [c.id for c in comments] == ["comment_test_post_1_0", "comment_test_post_1_2"]
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
@@ -0,0 +1,65 @@
+import pytest
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import patch
+from services.scraper.core import log_writer
+from services.scraper.core.log_writer import JsonlLogWriter
+
+
+class TestJsonlLogWriter:
+    """Unit tests for the batched scrape metadata writer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_file_open(self, tmp_path):
+        """Test entries from concurrent scans are appended in a single open per file."""
+        writer = JsonlLogWriter(flush_interval=60)
+        log_file = tmp_path / "tiktok_scrape_20240101.jsonl"
+
+        real_open = log_writer.aiofiles.open
+        with patch.object(log_writer.aiofiles, 'open', side_effect=real_open) as mock_open:
+            await asyncio.gather(*(
+                writer.write(log_file, {'handle': f"user_{i}"}) for i in range(20)
+            ))
+            await writer.flush()
+        writer._flush_task.cancel()
+
+        assert mock_open.call_count == 1
+        handles = [json.loads(line)['handle'] for line in log_file.read_text().splitlines()]
+        assert handles == [f"user_{i}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_inline(self, tmp_path):
+        """Test reaching max_batch writes to disk without waiting for the timer."""
+        writer = JsonlLogWriter(flush_interval=60, max_batch=3)
+        log_file = tmp_path / "instagram_scrape_20240101.jsonl"
+
+        for i in range(3):
+            await writer.write(log_file, {'handle': f"user_{i}"})
+
+        assert len(log_file.read_text().splitlines()) == 3
+        writer._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_and_cancels_timer(self, tmp_path):
+        """Test shutdown writes buffered entries without waiting for the flush timer."""
+        writer = JsonlLogWriter(flush_interval=60)
+        log_file = tmp_path / "instagram_scrape_20240101.jsonl"
+
+        await writer.write(log_file, {'handle': "user_0"})
+        timer = writer._flush_task
+        await writer.close()
+        await asyncio.sleep(0)
+
+        assert timer.cancelled()
+        assert json.loads(log_file.read_text())['handle'] == "user_0"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_datetimes_serialize_as_iso(self, use_orjson):
+        """Test datetimes are written as ISO-8601 with or without orjson."""
+        scraped_at = datetime(2024, 1, 1, 12, 30, 0, 250000)
+        with patch.object(log_writer, 'ORJSON_AVAILABLE', use_orjson and log_writer.ORJSON_AVAILABLE):
+            line = log_writer._dumps_line({'scraped_at': scraped_at})
+
+        assert line.endswith(b'\n')
+        assert json.loads(line)['scraped_at'] == scraped_at.isoformat()
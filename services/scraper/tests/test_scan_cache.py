@@ -0,0 +1,78 @@
+from unittest.mock import patch
+from shared.schemas.domain import Platform, DataCompleteness
+from shared.schemas.raw import RawProfile
+from services.scraper.core import scan_cache as scan_cache_module
+from services.scraper.core.scan_cache import ScanCache
+from services.scraper.core.types import ScrapeResult
+
+
+def _result(handle="creator", completeness=DataCompleteness.FULL, with_profile=True):
+    profile = RawProfile(
+        handle=handle,
+        platform=Platform.INSTAGRAM,
+        follower_count=1000,
+        following_count=10,
+        post_count=5,
+        bio="",
+        is_verified=False
+    ) if with_profile else None
+    return ScrapeResult(profile=profile, data_completeness=completeness)
+
+
+class TestScanCache:
+    """Unit tests for the process-wide scan result cache."""
+
+    def test_hit_is_marked_archival(self):
+        """Test a cached scan comes back as ARCHIVAL without changing the stored result."""
+        cache = ScanCache(ttl=60)
+        result = _result()
+        cache.put(Platform.INSTAGRAM, "Creator", result)
+
+        cached = cache.get(Platform.INSTAGRAM, "creator")
+
+        assert cached.data_completeness == DataCompleteness.ARCHIVAL
+        assert cached.profile == result.profile
+        assert result.data_completeness == DataCompleteness.FULL
+        assert cache.get(Platform.TIKTOK, "creator") is None
+
+    def test_partial_hit_keeps_its_completeness(self):
+        """Test a cached partial scan is not upgraded to ARCHIVAL's higher confidence."""
+        cache = ScanCache(ttl=60)
+        cache.put(Platform.INSTAGRAM, "creator", _result(completeness=DataCompleteness.PARTIAL_NO_COMMENTS))
+
+        cached = cache.get(Platform.INSTAGRAM, "creator")
+
+        assert cached.data_completeness == DataCompleteness.PARTIAL_NO_COMMENTS
+
+    def test_hits_do_not_share_lists(self):
+        """Test callers mutating a cached result don't change what the next caller gets."""
+        cache = ScanCache(ttl=60)
+        cache.put(Platform.INSTAGRAM, "creator", _result())
+
+        cache.get(Platform.INSTAGRAM, "creator").errors.append("mutated")
+
+        assert cache.get(Platform.INSTAGRAM, "creator").errors == []
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = ScanCache(ttl=60)
+        with patch.object(scan_cache_module.time, 'monotonic', return_value=1000.0):
+            cache.put(Platform.INSTAGRAM, "creator", _result())
+        with patch.object(scan_cache_module.time, 'monotonic', return_value=1061.0):
+            assert cache.get(Platform.INSTAGRAM, "creator") is None
+
+    def test_failed_scans_not_cached(self):
+        """Test scans without a profile are never stored, so retries rescrape."""
+        cache = ScanCache(ttl=60)
+        cache.put(Platform.INSTAGRAM, "blocked", _result(completeness=DataCompleteness.UNAVAILABLE, with_profile=False))
+
+        assert cache.get(Platform.INSTAGRAM, "blocked") is None
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Test the cache stays within maxsize by dropping the oldest entry."""
+        cache = ScanCache(ttl=60, maxsize=2)
+        for handle in ("a", "b", "c"):
+            cache.put(Platform.INSTAGRAM, handle, _result(handle))
+
+        assert cache.get(Platform.INSTAGRAM, "a") is None
+        assert cache.get(Platform.INSTAGRAM, "c") is not None
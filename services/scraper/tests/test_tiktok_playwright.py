@@ -6,6 +6,8 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from shared.schemas.domain import Platform, DataCompleteness
 from shared.schemas.raw import RawProfile, RawPost, RawComment
+from services.scraper.core.log_writer import scrape_log_writer
+from services.scraper.core.types import ScrapeResult
 from services.scraper.adapters.tiktok_playwright import TikTokPlaywrightScraper
 
 
@@ -35,7 +37,10 @@ class TestTikTokPlaywrightScraper:
         context = AsyncMock()
         context.new_page = AsyncMock(return_value=mock_page)
         context.add_init_script = AsyncMock()
+        context.route = AsyncMock()
+        context.set_default_navigation_timeout = MagicMock()
         context.close = AsyncMock()
+        mock_page.context = context
         return context
         
     @pytest.fixture
@@ -55,17 +60,18 @@ class TestTikTokPlaywrightScraper:
         pw.chromium.launch = AsyncMock(return_value=mock_browser)
         return pw
         
+    @pytest.fixture
+    def shared_browser(self, mock_browser, monkeypatch):
+        """Hand run_scan the mock browser in place of the process-wide Chromium."""
+        monkeypatch.delenv('TT_USERDATA', raising=False)
+        with patch('services.scraper.adapters.tiktok_playwright.get_browser', AsyncMock(return_value=mock_browser)):
+            yield mock_browser
+        
     @pytest.mark.asyncio
     async def test_login_wall_detection(self, scraper, mock_page):
         """Test detection of login wall."""
         # Mock login form elements
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [MagicMock()],  # Login elements found
-            [],  # No rate limiting
-            [],  # No challenge
-            [],  # Not private
-            []   # Not 404
-        ])
+        mock_page.evaluate = AsyncMock(return_value={'login': True})  # Login elements found
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
@@ -75,13 +81,7 @@ class TestTikTokPlaywrightScraper:
     @pytest.mark.asyncio
     async def test_rate_limiting_detection(self, scraper, mock_page):
         """Test detection of rate limiting."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [MagicMock()],  # Rate limiting detected
-            [],  # No challenge
-            [],  # Not private
-            []   # Not 404
-        ])
+        mock_page.evaluate = AsyncMock(return_value={'text': "Too many requests. Please try again later."})  # Rate limiting detected
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
@@ -91,13 +91,7 @@ class TestTikTokPlaywrightScraper:
     @pytest.mark.asyncio
     async def test_challenge_captcha_detection(self, scraper, mock_page):
         """Test detection of challenge/captcha."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [MagicMock()],  # Challenge detected
-            [],  # Not private
-            []   # Not 404
-        ])
+        mock_page.evaluate = AsyncMock(return_value={'challenge': True})  # Challenge detected
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
@@ -107,13 +101,7 @@ class TestTikTokPlaywrightScraper:
     @pytest.mark.asyncio
     async def test_private_profile_detection(self, scraper, mock_page):
         """Test detection of private profile."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [],  # No challenge
-            [MagicMock()],  # Private profile detected
-            []   # Not 404
-        ])
+        mock_page.evaluate = AsyncMock(return_value={'text': "This account is private"})  # Private profile detected
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
@@ -123,13 +111,7 @@ class TestTikTokPlaywrightScraper:
     @pytest.mark.asyncio
     async def test_profile_not_found_detection(self, scraper, mock_page):
         """Test detection of 404/profile not found."""
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [],  # No login wall
-            [],  # No rate limiting
-            [],  # No challenge
-            [],  # Not private
-            [MagicMock()]  # 404 detected
-        ])
+        mock_page.evaluate = AsyncMock(return_value={'text': "Sorry, we couldn't find this account."})  # 404 detected
         
         scraper.page = mock_page
         errors = await scraper._detect_blocking_mechanisms()
@@ -152,15 +134,14 @@ class TestTikTokPlaywrightScraper:
         )
         
         # Mock comments disabled
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [MagicMock()],  # Comments disabled found
-            []  # No comment elements
-        ])
+        mock_page.evaluate = AsyncMock(return_value="Comments disabled by the creator")
+        mock_page.eval_on_selector_all = AsyncMock(return_value=[])
         
         scraper.page = mock_page
         comments = await scraper._extract_comments(post)
         
         assert len(comments) == 0
+        mock_page.eval_on_selector_all.assert_not_called()
         
     @pytest.mark.asyncio
     async def test_parse_count_formats(self, scraper):
@@ -188,58 +169,43 @@ class TestTikTokPlaywrightScraper:
         assert result is None
         
     @pytest.mark.asyncio
-    async def test_run_scan_with_login_wall(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_run_scan_with_login_wall(self, scraper, mock_page, shared_browser):
         """Test complete scan when login wall is encountered."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock blocking detection
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [MagicMock()],  # Login wall detected
-                [], [], [], []
-            ])
-            
-            result = await scraper.run_scan("test_user")
-            
-            assert result.data_completeness == DataCompleteness.UNAVAILABLE
-            assert "Login wall detected" in result.errors
-            assert result.profile is None
+        # Mock blocking detection
+        mock_page.evaluate = AsyncMock(return_value={'login': True})
+        
+        result = await scraper.run_scan("test_user")
+        
+        assert result.data_completeness == DataCompleteness.UNAVAILABLE
+        assert "Login wall detected" in result.errors
+        assert result.profile is None
+        shared_browser.new_context.assert_awaited_once()
             
     @pytest.mark.asyncio
-    async def test_run_scan_with_private_profile(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_run_scan_with_private_profile(self, scraper, mock_page, shared_browser):
         """Test complete scan when profile is private."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock private profile detection
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [], [], [], [MagicMock()], []  # Private profile detected
-            ])
-            
-            result = await scraper.run_scan("private_user")
-            
-            assert result.data_completeness == DataCompleteness.UNAVAILABLE
-            assert "Private profile detected" in result.errors
-            assert result.profile is None
+        # Mock private profile detection
+        mock_page.evaluate = AsyncMock(return_value={'text': "This account is private"})
+        
+        result = await scraper.run_scan("private_user")
+        
+        assert result.data_completeness == DataCompleteness.UNAVAILABLE
+        assert "Private profile detected" in result.errors
+        assert result.profile is None
             
     @pytest.mark.asyncio
-    async def test_run_scan_with_rate_limiting(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_run_scan_with_rate_limiting(self, scraper, mock_page, shared_browser):
         """Test complete scan when rate limited."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock successful profile extraction but rate limiting on videos
-            mock_page.query_selector_all = AsyncMock(side_effect=[
-                [], [], [], [], []  # No blocking mechanisms
-            ])
-            
-            # Mock profile data extraction
-            mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 likes")
+        # Mock successful profile extraction but rate limiting on videos
+        mock_page.evaluate = AsyncMock(return_value={})  # No blocking mechanisms
+        
+        # Mock profile data extraction
+        mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 likes")
+        
+        with patch.object(scraper, '_extract_posts', side_effect=Exception("Rate limited")):
+            result = await scraper.run_scan("test_user")
             
-            with patch.object(scraper, '_extract_posts', side_effect=Exception("Rate limited")):
-                result = await scraper.run_scan("test_user")
-                
-                assert "Video extraction error: Rate limited" in result.errors
+            assert "Video extraction error: Rate limited" in result.errors
                 
     @pytest.mark.asyncio
     async def test_log_scrape_metadata(self, scraper, tmp_path):
@@ -248,14 +214,14 @@ class TestTikTokPlaywrightScraper:
         logs_dir = tmp_path / "logs"
         logs_dir.mkdir()
         
-        with patch('os.path.dirname', return_value=str(tmp_path)), \
-             patch('os.makedirs'):
+        with patch('services.scraper.adapters.tiktok_playwright.SCRAPE_LOG_DIR', logs_dir):
             
             await scraper._log_scrape_metadata(
                 "test_user",
                 ["Login wall detected"],
                 DataCompleteness.UNAVAILABLE
             )
+            await scrape_log_writer.flush()
             
             # Check log file was created
             log_files = list(logs_dir.glob("*.jsonl"))
@@ -268,7 +234,7 @@ class TestTikTokPlaywrightScraper:
             assert log_entry['handle'] == "test_user"
             assert log_entry['platform'] == "tiktok"
             assert log_entry['failure_reason'] == "Login wall detected"
-            assert log_entry['data_completeness'] == "UNAVAILABLE"
+            assert log_entry['data_completeness'] == DataCompleteness.UNAVAILABLE.value
             
     @pytest.mark.asyncio
     async def test_cleanup_resources(self, scraper, mock_page, mock_browser_context, mock_browser):
@@ -284,44 +250,44 @@ class TestTikTokPlaywrightScraper:
         mock_browser.close.assert_called_once()
         
     @pytest.mark.asyncio
-    async def test_browser_initialization_failure(self, scraper):
+    async def test_browser_initialization_failure(self, scraper, monkeypatch):
         """Test handling of browser initialization failure."""
-        with patch('playwright.async_api.async_playwright', side_effect=Exception("Browser failed")):
+        monkeypatch.delenv('TT_USERDATA', raising=False)
+        
+        with patch('services.scraper.adapters.tiktok_playwright.get_browser', AsyncMock(side_effect=Exception("Browser failed"))):
             result = await scraper.run_scan("test_user")
             
             assert result.data_completeness == DataCompleteness.FAILED
-            assert "Browser initialization failed" in result.errors
+            assert "Browser initialization failed: Browser failed" in result.errors
             
     @pytest.mark.asyncio
-    async def test_partial_data_extraction(self, scraper, mock_page, mock_browser_context, mock_browser, mock_playwright):
+    async def test_partial_data_extraction(self, scraper, mock_page, shared_browser):
         """Test scan with partial data extraction (some data available)."""
-        with patch('playwright.async_api.async_playwright') as mock_pw_factory:
-            mock_pw_factory.return_value.__aenter__.return_value = mock_playwright
-            
-            # Mock successful profile extraction
-            mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 likes")
-            
-            # Mock some videos but fail on comments
-            with patch.object(scraper, '_extract_posts', return_value=[
-                RawPost(
-                    id="video_1",
-                    platform=Platform.TIKTOK,
-                    url="https://tiktok.com/@user/video/1234567890/",
-                    timestamp=datetime.utcnow(),
-                    like_count=100,
-                    comment_count=10,
-                    is_video=True,
-                    media_urls=[]
-                )
-            ]):
-                with patch.object(scraper, '_extract_comments', side_effect=Exception("Comments blocked")):
-                    result = await scraper.run_scan("test_user")
-                    
-                    assert result.profile is not None
-                    assert len(result.posts) == 1
-                    assert len(result.comments) == 0
-                    assert "Comments blocked on 1 videos" in result.errors
-                    
+        # Mock successful profile extraction
+        mock_page.get_attribute = AsyncMock(return_value="1,234 followers, 567 following, 89 likes")
+        
+        # Mock some videos but fail on comments
+        with patch.object(scraper, '_extract_posts', return_value=[
+            RawPost(
+                id="video_1",
+                platform=Platform.TIKTOK,
+                url="https://tiktok.com/@user/video/1234567890/",
+                timestamp=datetime.utcnow(),
+                like_count=100,
+                comment_count=10,
+                is_video=True,
+                media_urls=[]
+            )
+        ]):
+            with patch.object(scraper, '_extract_comments_api', return_value=None), \
+                 patch.object(scraper, '_extract_comments_dom', side_effect=Exception("Comments blocked")):
+                result = await scraper.run_scan("test_user")
+                
+                assert result.profile is not None
+                assert len(result.posts) == 1
+                assert len(result.comments) == 0
+                assert "Comments blocked on all videos" in result.errors
+                
     @pytest.mark.asyncio
     async def test_empty_profile_data_fallback(self, scraper, mock_page):
         """Test fallback behavior when profile data extraction returns empty."""
@@ -358,15 +324,10 @@ class TestTikTokPlaywrightScraper:
             is_verified=False
         )
         
-        # Mock video elements with view counts
-        mock_link = AsyncMock()
-        mock_link.get_attribute = AsyncMock(return_value="/video/1234567890/")
-        
-        mock_view_element = AsyncMock()
-        mock_view_element.inner_text = AsyncMock(return_value="1.2M views")
-        
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_link])
-        mock_link.query_selector_all = AsyncMock(return_value=[mock_view_element])
+        # Mock batched video extraction with view counts
+        mock_page.eval_on_selector_all = AsyncMock(return_value=[
+            {'href': "/video/1234567890/", 'stats': ["1.2M views"]}
+        ])
         
         scraper.page = mock_page
         posts = await scraper._extract_posts(profile, limit=1)
@@ -374,27 +335,23 @@ class TestTikTokPlaywrightScraper:
         assert len(posts) == 1
         assert posts[0].is_video == True
         assert posts[0].view_count == 1200000  # 1.2M views
+        assert posts[0].url == "https://www.tiktok.com/video/1234567890/"
         
     @pytest.mark.asyncio
     async def test_tiktok_specific_selectors(self, scraper, mock_page):
         """Test TikTok-specific data attribute selectors."""
-        # Mock TikTok-specific elements
-        mock_user_info = AsyncMock()
-        mock_followers = AsyncMock()
-        mock_followers.inner_text = AsyncMock(return_value="1.2M")
-        
-        mock_following = AsyncMock()
-        mock_following.inner_text = AsyncMock(return_value="567")
-        
-        mock_likes = AsyncMock()
-        mock_likes.inner_text = AsyncMock(return_value="89.5K")
-        
-        mock_page.query_selector_all = AsyncMock(side_effect=[
-            [mock_user_info],  # user-info
-            [mock_followers],   # followers-count
-            [mock_following], # following-count
-            [mock_likes]        # likes-count
-        ])
+        # Mock the profile snapshot read through TikTok-specific selectors
+        mock_page.evaluate = AsyncMock(return_value={
+            'state': None,
+            'ogDescription': None,
+            'userInfo': True,
+            'followers': "1.2M",
+            'following': "567",
+            'likes': "89.5K",
+            'bio': None,
+            'verified': False,
+            'statsTexts': []
+        })
         
         scraper.page = mock_page
         
@@ -404,4 +361,391 @@ class TestTikTokPlaywrightScraper:
             assert result is not None
             assert result.follower_count == 1200000  # 1.2M
             assert result.following_count == 567
-            assert result.post_count == 89500  # 89.5K likes used as post count
\ No newline at end of file
+            assert result.post_count == 89500  # 89.5K likes used as post count
+            
+        # Every strategy reads the one snapshot; no per-element round-trips
+        mock_page.evaluate.assert_awaited_once()
+        selectors = mock_page.evaluate.await_args.args[1]
+        assert selectors['followers'] == '[data-e2e="followers-count"]'
+        mock_page.query_selector_all.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_run_scan_many_uses_pooled_contexts(self, scraper, mock_browser):
+        """Test concurrent multi-handle scans run on pages from a bounded context pool."""
+        scraper.browser = mock_browser
+        scraper.context = AsyncMock()
+        scraper.page = AsyncMock()
+        pages = []
+        
+        async def new_page():
+            page = AsyncMock()
+            pages.append(page)
+            return page
+            
+        async def new_context(**kwargs):
+            # Yield like a real launch so concurrent callers race for the free slots
+            await asyncio.sleep(0)
+            context = AsyncMock()
+            context.set_default_navigation_timeout = MagicMock()
+            context.new_page = AsyncMock(side_effect=new_page)
+            return context
+            
+        mock_browser.new_context = AsyncMock(side_effect=new_context)
+        
+        async def scan_handle(handle, page):
+            await asyncio.sleep(0)
+            return ScrapeResult(data_completeness=DataCompleteness.FULL, errors=[handle])
+            
+        with patch('services.scraper.adapters.tiktok_playwright.CONTEXT_POOL_SIZE', 2):
+            with patch.object(scraper, '_scan_handle', side_effect=scan_handle) as mock_scan:
+                results = await scraper.run_scan_many(["a", "b", "c", "d"])
+                
+        assert [r.errors for r in results] == [["a"], ["b"], ["c"], ["d"]]
+        assert mock_browser.new_context.await_count == 2
+        user_agents = [call.kwargs['user_agent'] for call in mock_browser.new_context.await_args_list]
+        assert user_agents[0] != user_agents[1]
+        # One long-lived page per pooled context, reused across handles
+        assert len(pages) == 2
+        assert {id(call.args[1]) for call in mock_scan.call_args_list} == {id(p) for p in pages}
+        for page in pages:
+            page.close.assert_not_awaited()
+            
+    @pytest.mark.asyncio
+    async def test_route_filter_blocks_heavy_resources(self):
+        """Test images, media and tracker calls are aborted while documents pass through."""
+        from services.scraper.adapters.tiktok_playwright import _route_filter
+        
+        async def route_for(resource_type, url):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            route.request.url = url
+            route.abort = AsyncMock()
+            route.continue_ = AsyncMock()
+            await _route_filter(route)
+            return route
+            
+        for resource_type, url in [
+            ('image', "https://p16-sign.tiktokcdn.com/avatar.jpeg"),
+            ('font', "https://www.tiktok.com/fonts/proxima.woff2"),
+            ('fetch', "https://www.tiktok.com/api/log/collect"),
+        ]:
+            (await route_for(resource_type, url)).abort.assert_awaited_once()
+            
+        # Documents, the JS bundles and the request signer are needed for the grid and comment API
+        for resource_type, url in [
+            ('document', "https://www.tiktok.com/@user"),
+            ('script', "https://lf16-tiktok-web.tiktokcdn.com/obj/tiktok-web/webapp/main/app.js"),
+            ('script', "https://sf16-sg.tiktokcdn.com/obj/rc-web-sdk-sg/webmssdk/webmssdk.js"),
+            ('xhr', "https://mssdk-va.tiktok.com/web/report"),
+        ]:
+            route = await route_for(resource_type, url)
+            route.continue_.assert_awaited_once()
+            route.abort.assert_not_awaited()
+            
+    @pytest.mark.asyncio
+    async def test_profile_from_hydration_state(self, scraper, mock_page):
+        """Test profile fields come from SIGI_STATE without touching the DOM."""
+        sigi_state = {
+            'UserModule': {
+                'users': {'test_user': {'signature': "Creator bio", 'verified': True}},
+                'stats': {'test_user': {
+                    'followerCount': 1200000, 'followingCount': 567,
+                    'heartCount': 89500, 'videoCount': 42
+                }}
+            }
+        }
+        mock_page.evaluate = AsyncMock(return_value={'state': json.dumps(sigi_state), 'ogDescription': None})
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.follower_count == 1200000
+        assert result.following_count == 567
+        assert result.post_count == 42
+        assert result.bio == "Creator bio"
+        assert result.is_verified is True
+        mock_page.query_selector_all.assert_not_called()
+            
+    @pytest.mark.asyncio
+    async def test_setup_uses_persistent_profile_when_configured(self, scraper, mock_page, mock_browser_context):
+        """Test TT_USERDATA switches setup to a persistent on-disk browser profile."""
+        pw = MagicMock()
+        pw.chromium.launch = AsyncMock()
+        pw.chromium.launch_persistent_context = AsyncMock(return_value=mock_browser_context)
+        mock_browser_context.browser = None
+        with patch('services.scraper.adapters.tiktok_playwright.get_playwright', AsyncMock(return_value=pw)):
+            with patch.dict(os.environ, {'TT_USERDATA': '/tmp/tt_profile'}):
+                await scraper._setup_browser()
+                
+        pw.chromium.launch.assert_not_called()
+        assert pw.chromium.launch_persistent_context.call_args.args[0] == '/tmp/tt_profile'
+        assert scraper.context is mock_browser_context
+        assert scraper.page is mock_page
+        mock_browser_context.add_init_script.assert_awaited_once()
+        assert scraper.session_metadata['browser_version'] == 'unknown'
+            
+    @pytest.mark.asyncio
+    async def test_comments_extracted_in_one_batch(self, scraper, mock_page):
+        """Test comment text and authors come from a single $$eval round-trip."""
+        post = RawPost(
+            id="test_video_1",
+            platform=Platform.TIKTOK,
+            url="https://tiktok.com/@user/video/1234567890/",
+            timestamp=datetime.utcnow(),
+            like_count=100,
+            comment_count=3,
+            is_video=True,
+            media_urls=[]
+        )
+        mock_page.eval_on_selector_all = AsyncMock(return_value=[
+            {'text': "Love this product!", 'authorHref': "/@fan_one", 'authorText': "fan_one"},
+            {'text': "", 'authorHref': None, 'authorText': ""},
+            {'text': "Where can I buy it?", 'authorHref': None, 'authorText': "@fan_two"}
+        ])
+        scraper.page = mock_page
+        
+        comments = await scraper._extract_comments(post, limit=3)
+        
+        assert [c.text for c in comments] == ["Love this product!", "Where can I buy it?"]
+        assert [c.author_id for c in comments] == ["fan_one", "fan_two"]
+        assert mock_page.eval_on_selector_all.await_args.args[2] == 3
+            
+    @pytest.mark.asyncio
+    async def test_async_context_manager_cleans_up(self, scraper, mock_page, mock_browser_context, mock_browser):
+        """Test that leaving the async context closes browser resources."""
+        async def fake_setup():
+            scraper.page = mock_page
+            scraper.context = mock_browser_context
+            scraper.browser = mock_browser
+            
+        with patch.object(scraper, '_setup_browser', side_effect=fake_setup):
+            async with scraper as entered:
+                assert entered is scraper
+                
+        mock_page.close.assert_called_once()
+        mock_browser_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
+            
+    @pytest.mark.asyncio
+    async def test_comments_from_api_skip_page_render(self, scraper, mock_page):
+        """Test comments come from the JSON comment API when it answers, without navigating."""
+        post = RawPost(
+            id="test_video_1",
+            platform=Platform.TIKTOK,
+            url="https://www.tiktok.com/@user/video/1234567890",
+            timestamp=datetime.utcnow(),
+            like_count=100,
+            comment_count=1,
+            is_video=True,
+            media_urls=[]
+        )
+        response = MagicMock()
+        response.ok = True
+        response.json = AsyncMock(return_value={
+            'status_code': 0,
+            'comments': [{
+                'cid': "7301", 'text': "Obsessed with this", 'create_time': 1700000000,
+                'digg_count': 12, 'reply_comment_total': 2, 'user': {'unique_id': "fan_one"}
+            }]
+        })
+        mock_page.context = MagicMock()
+        mock_page.context.request.get = AsyncMock(return_value=response)
+        scraper.page = mock_page
+        
+        comments = await scraper._extract_comments(post, limit=20)
+        
+        assert len(comments) == 1
+        assert comments[0].author_id == "fan_one"
+        assert comments[0].like_count == 12
+        assert comments[0].reply_count == 2
+        assert mock_page.context.request.get.await_args.kwargs['params']['aweme_id'] == "1234567890"
+        mock_page.goto.assert_not_called()
+        
+    @pytest.mark.parametrize("payload", [
+        {'status_code': 10201, 'comments': None},
+        {'status_code': 0, 'comments': None},
+        {'status_code': 0},
+    ])
+    @pytest.mark.asyncio
+    async def test_comments_fall_back_to_dom_when_api_rejects(self, scraper, mock_page, payload):
+        """Test a non-zero status_code or a missing comment list falls back to rendering the video page."""
+        post = RawPost(
+            id="test_video_1",
+            platform=Platform.TIKTOK,
+            url="https://www.tiktok.com/@user/video/1234567890",
+            timestamp=datetime.utcnow(),
+            like_count=100,
+            comment_count=1,
+            is_video=True,
+            media_urls=[]
+        )
+        response = MagicMock()
+        response.ok = True
+        response.json = AsyncMock(return_value=payload)
+        mock_page.context = MagicMock()
+        mock_page.context.request.get = AsyncMock(return_value=response)
+        mock_page.eval_on_selector_all = AsyncMock(return_value=[
+            {'text': "From the DOM", 'authorHref': "/@fan_two", 'authorText': "fan_two"}
+        ])
+        scraper.page = mock_page
+        
+        comments = await scraper._extract_comments(post)
+        
+        assert [c.text for c in comments] == ["From the DOM"]
+        mock_page.goto.assert_awaited_once()
+            
+    @pytest.mark.asyncio
+    async def test_profile_strategies_stop_once_complete(self, scraper, mock_page):
+        """Test later DOM strategies are skipped once every field is found, but exact meta counts still apply."""
+        with patch.object(scraper, '_profile_from_user_info', return_value={
+            'follower_count': 1200000, 'following_count': 10, 'like_count': 5000
+        }), patch.object(scraper, '_profile_from_bio', return_value={
+            'bio': "Creator bio", 'is_verified': False
+        }), patch.object(scraper, '_profile_from_stats_text') as stats_text, \
+             patch.object(scraper, '_profile_from_meta', return_value={'follower_count': 1234567}) as meta, \
+             patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            scraper.page = mock_page
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.follower_count == 1234567
+        assert result.following_count == 10
+        assert result.bio == "Creator bio"
+        stats_text.assert_not_called()
+        meta.assert_awaited_once()
+            
+    @pytest.mark.asyncio
+    async def test_comments_scraped_concurrently_on_separate_pages(self, scraper, mock_page):
+        """Test the DOM fallback loads each video on its own page and failures are counted per video."""
+        profile = RawProfile(
+            handle="test_user",
+            platform=Platform.TIKTOK,
+            follower_count=1000,
+            following_count=500,
+            post_count=3,
+            is_verified=False
+        )
+        posts = [
+            RawPost(
+                id=f"video_{i}",
+                platform=Platform.TIKTOK,
+                url=f"https://www.tiktok.com/@test_user/video/{i}",
+                timestamp=datetime.utcnow(),
+                like_count=0,
+                comment_count=0,
+                is_video=True
+            )
+            for i in range(3)
+        ]
+        video_pages = [AsyncMock() for _ in posts]
+        mock_page.context = MagicMock()
+        mock_page.context.new_page = AsyncMock(side_effect=video_pages)
+        
+        async def extract_comments(post, limit, page):
+            if post.id == "video_1":
+                raise Exception("Comments blocked")
+            return [RawComment(id=f"c_{post.id}", text="nice", timestamp=post.timestamp, author_id="fan")]
+            
+        with patch.object(scraper, '_extract_profile_data', return_value=profile), \
+             patch.object(scraper, '_extract_posts', return_value=posts), \
+             patch.object(scraper, '_extract_comments_api', return_value=None), \
+             patch.object(scraper, '_extract_comments_dom', side_effect=extract_comments) as mock_extract, \
+             patch.object(scraper, '_log_scrape_metadata'):
+            result = await scraper._scan_handle("test_user", mock_page)
+            
+        assert sorted(c.id for c in result.comments) == ["c_video_0", "c_video_2"]
+        assert "Comments blocked on 1 videos" in result.errors
+        assert {id(call.args[2]) for call in mock_extract.call_args_list} == {id(p) for p in video_pages}
+        for video_page in video_pages:
+            video_page.close.assert_awaited_once()
+            
+    @pytest.mark.asyncio
+    async def test_api_comments_need_no_video_page(self, scraper, mock_page):
+        """Test comments served by the API never open a page for the video."""
+        post = RawPost(
+            id="video_0",
+            platform=Platform.TIKTOK,
+            url="https://www.tiktok.com/@test_user/video/1",
+            timestamp=datetime.utcnow(),
+            like_count=0,
+            comment_count=1,
+            is_video=True
+        )
+        api_comments = [RawComment(id="c_1", text="nice", timestamp=post.timestamp, author_id="fan")]
+        mock_page.context = MagicMock()
+        mock_page.context.new_page = AsyncMock()
+        
+        with patch.object(scraper, '_extract_comments_api', return_value=api_comments):
+            comments = await scraper._scrape_video_comments(post, mock_page, asyncio.Semaphore(1))
+            
+        assert comments == api_comments
+        mock_page.context.new_page.assert_not_called()
+            
+    @pytest.mark.asyncio
+    async def test_meta_counts_come_from_head_snapshot(self, scraper, mock_page):
+        """Test og:description counts are read from the same head snapshot as the hydration state."""
+        mock_page.evaluate = AsyncMock(return_value={
+            'state': None,
+            'ogDescription': "1,234 Followers, 56 Following, 7,890 Likes"
+        })
+        scraper.page = mock_page
+        
+        with patch.object(scraper, '_detect_blocking_mechanisms', return_value=[]):
+            result = await scraper._extract_profile_data("test_user")
+            
+        assert result.follower_count == 1234
+        assert result.following_count == 56
+        mock_page.get_attribute.assert_not_called()
+            
+    @pytest.mark.asyncio
+    async def test_blocking_opens_circuit_with_backoff(self, scraper, mock_page):
+        """Test a login wall pauses further scans instead of re-hitting the wall."""
+        with patch.object(scraper, '_extract_profile_data', return_value=None), \
+             patch.object(scraper, '_detect_blocking_mechanisms', return_value=["Login wall detected"]), \
+             patch.object(scraper, '_log_scrape_metadata'):
+            first = await scraper._scan_handle("user_a", mock_page)
+            second = await scraper._scan_handle("user_b", mock_page)
+            
+            assert "Login wall detected" in first.errors
+            assert second.data_completeness == DataCompleteness.FAILED
+            assert second.errors[0].startswith("Circuit open (rate limited)")
+            assert scraper._extract_profile_data.call_count == 1
+            
+            # Window elapsed and still blocked: backoff doubles
+            scraper._blocked_until = 0.0
+            with patch('services.scraper.adapters.tiktok_playwright.time.monotonic', return_value=1000.0):
+                await scraper._scan_handle("user_c", mock_page)
+            assert scraper._blocked_until == 1000.0 + 60.0
+            
+    @pytest.mark.asyncio
+    async def test_private_profile_does_not_open_circuit(self, scraper, mock_page):
+        """Test per-profile states like private accounts leave the circuit closed."""
+        with patch.object(scraper, '_extract_profile_data', return_value=None), \
+             patch.object(scraper, '_detect_blocking_mechanisms', return_value=["Private profile detected"]), \
+             patch.object(scraper, '_log_scrape_metadata'):
+            await scraper._scan_handle("private_user", mock_page)
+            
+        assert scraper._blocked_until == 0.0
+        
+    @pytest.mark.asyncio
+    async def test_blocked_pooled_context_is_rotated(self, scraper, mock_browser):
+        """Test the context that hit a block is closed and replaced before reuse."""
+        scraper.browser = mock_browser
+        contexts = []
+        
+        def new_context(**kwargs):
+            context = AsyncMock()
+            context.set_default_navigation_timeout = MagicMock()
+            contexts.append(context)
+            return context
+            
+        mock_browser.new_context = AsyncMock(side_effect=new_context)
+        
+        async with scraper._acquire_context() as context:
+            page = MagicMock()
+            page.context = context
+            scraper._trip_circuit(page)
+            
+        contexts[0].close.assert_awaited_once()
+        assert scraper._pooled_contexts == [contexts[1]]
+        assert scraper._idle_contexts.get_nowait() is contexts[1]
@@ -1,8 +1,13 @@
+import sys
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from .domain import Platform
 
+# Comments up to this length ("🔥🔥", "amazing", handles) repeat heavily across a
+# scan, so they are interned and every duplicate shares one string object
+INTERN_MAX_LEN = 32
+
 class RawComment(BaseModel):
     id: str
     text: str
@@ -12,6 +17,11 @@ class RawComment(BaseModel):
     reply_count: int = 0
     is_pinned: bool = False
 
+    @field_validator('text', 'author_id')
+    @classmethod
+    def _intern_short(cls, value: str) -> str:
+        return sys.intern(value) if len(value) <= INTERN_MAX_LEN else value
+
 class RawPost(BaseModel):
     id: str
     platform: Platform
@@ -17,14 +17,33 @@ def main():
     print("Health check: http://localhost:8000/health")
     print("Async health check: http://localhost:8000/api/health/async")
     print("API docs: http://localhost:8000/docs")
+    print("Set RELOAD=1 for auto-reload during development")
     print()
     
+    # Auto-reload (a file-watching supervisor) is for development only; set RELOAD=1 to enable
+    reload = os.getenv("RELOAD", "0") == "1"
+    # Jobs live in the in-memory JobRegistry of one process: a status poll routed to another
+    # worker would never find the job, so refuse WORKERS>1 until there is a shared job store
+    workers = 1 if reload else int(os.getenv("WORKERS", "1"))
+    if workers > 1:
+        print(f"❌ WORKERS={workers} is not supported: job state is held in memory by a single process.")
+        print("Unset WORKERS or set WORKERS=1.")
+        sys.exit(1)
+    # Per-request access logging costs time inside the 100ms status budget; ACCESS_LOG=1 restores it
+    access_log = os.getenv("ACCESS_LOG", "0") == "1"
+    
     # Run the FastAPI application
     uvicorn.run(
         "services.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        # "auto" runs on uvloop and the httptools parser whenever they are installed
+        # and falls back to asyncio/h11 where they have no build, e.g. Windows
+        loop="auto",
+        http="auto",
+        access_log=access_log,
         log_level="info"
     )
 
@@ -0,0 +1,41 @@
+import asyncio
+import unittest
+from services.api.job_manager import JobRegistry, JobPhase
+from shared.schemas.domain import Platform, ScrapeStatus
+
+class TestJobRegistryLongPoll(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.registry = JobRegistry()
+        self.job_id = await self.registry.create_job("creator", Platform.INSTAGRAM)
+
+    async def test_wait_returns_immediately_without_since(self):
+        job = await self.registry.wait_for_update(self.job_id, None, timeout=5)
+
+        self.assertEqual(job.job_id, self.job_id)
+        self.assertEqual(job.status, ScrapeStatus.PENDING)
+
+    async def test_wait_wakes_on_status_change(self):
+        seen = (await self.registry.get_job(self.job_id)).updated_at
+        waiter = asyncio.create_task(self.registry.wait_for_update(self.job_id, seen, timeout=5))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        await self.registry.update_job_status(self.job_id, ScrapeStatus.PROCESSING, JobPhase.SCRAPING, percent=10)
+        job = await asyncio.wait_for(waiter, timeout=1)
+
+        self.assertEqual(job.phase, JobPhase.SCRAPING)
+        self.assertEqual(job.percent, 10)
+
+    async def test_wait_times_out_with_current_state(self):
+        seen = (await self.registry.get_job(self.job_id)).updated_at
+
+        job = await self.registry.wait_for_update(self.job_id, seen, timeout=0.05)
+
+        self.assertEqual(job.status, ScrapeStatus.PENDING)
+
+    async def test_wait_for_unknown_job_returns_none(self):
+        self.assertIsNone(await self.registry.wait_for_update("missing", None, timeout=0.05))
+
+if __name__ == '__main__':
+    unittest.main()